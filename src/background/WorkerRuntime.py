@@ -0,0 +1,121 @@
+import asyncio
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Iterator, List, Optional
+
+from kimera.helpers.Helpers import Helpers
+
+
+class WorkerRuntime:
+    """
+    Per worker process state shared by the byzantium tasks: one long lived event loop running in a daemon
+    thread, and an LRU of built operators keyed by their definition, so a task only pays for the operator call.
+    Operators keeping per call state (hydra heads) are leased instead, one task at a time.
+    The runtime is rebuilt after a fork (prefork pools import the tasks before forking).
+    """
+    _instance: Optional["WorkerRuntime"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, max_operators: int = 32, max_idle: int = 4):
+        self.pid = os.getpid()
+        self.max_operators = max_operators
+        self.max_idle = max_idle
+        self._operators: OrderedDict[str, Any] = OrderedDict()
+        self._idle: OrderedDict[str, List[Any]] = OrderedDict()
+        self._operators_lock = threading.Lock()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="byzantium-loop", daemon=True)
+        self._thread.start()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def current(cls) -> "WorkerRuntime":
+        with cls._instance_lock:
+            if cls._instance is None or cls._instance.pid != os.getpid():
+                cls._instance = cls(max_operators=int(os.getenv("WORKER_OPERATOR_CACHE", 32)))
+            return cls._instance
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self._loop
+
+    def run(self, coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+        """
+        Runs coro on the worker loop and blocks the calling task thread until it is done.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result(timeout)
+
+    @staticmethod
+    def key(kind: str, definition: dict) -> str:
+        payload = json.dumps([kind, definition], sort_keys=True, default=repr)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def operator(self, kind: str, definition: dict, build: Callable[[], Any]) -> Any:
+        """
+        Built operator for definition, build() runs on a miss. Two tasks missing the same key concurrently
+        may both build, the last one is kept.
+        """
+        key = self.key(kind, definition)
+        with self._operators_lock:
+            if key in self._operators:
+                self.hits += 1
+                self._operators.move_to_end(key)
+                return self._operators[key]
+            self.misses += 1
+
+        instance = build()
+        with self._operators_lock:
+            self._operators[key] = instance
+            self._operators.move_to_end(key)
+            while len(self._operators) > self.max_operators:
+                self._operators.popitem(last=False)
+        return instance
+
+    @contextmanager
+    def lease(self, kind: str, definition: dict, build: Callable[[], Any]) -> Iterator[Any]:
+        """
+        Exclusive use of an operator for definition: an idle one is handed out or build() makes a new one,
+        it goes back to the idle list (at most max_idle per definition) when the block exits.
+        """
+        key = self.key(kind, definition)
+        instance = None
+        with self._operators_lock:
+            idle = self._idle.get(key)
+            if idle:
+                instance = idle.pop()
+                self._idle.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if instance is None:
+            instance = build()
+        try:
+            yield instance
+        finally:
+            with self._operators_lock:
+                idle = self._idle.setdefault(key, [])
+                self._idle.move_to_end(key)
+                if len(idle) < self.max_idle:
+                    idle.append(instance)
+                while len(self._idle) > self.max_operators:
+                    self._idle.popitem(last=False)
+
+    def clear(self):
+        with self._operators_lock:
+            self._operators.clear()
+            self._idle.clear()
+
+    def stats(self) -> dict:
+        return {"pid": self.pid, "operators": len(self._operators), "idle": sum(len(idle) for idle in self._idle.values()),
+                "hits": self.hits, "misses": self.misses}
+
+    def shutdown(self):
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        Helpers.sysPrint("WORKER RUNTIME STOPPED", self.stats())
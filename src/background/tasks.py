@@ -13,6 +13,7 @@ from ..synode.blackboard.Blackboard import BlackboardHandler
 from ..synode.SynodeFactory import SynodeFactory
 from ..synode.helpers.Helpers import Helpers as SynodeHelpers
 from ..synode.schematics.SynodeConfig import SynodeAgent, Operator
+from .WorkerRuntime import WorkerRuntime
 
 
 boot = Bootstrap()
@@ -40,9 +41,37 @@ if tm_app:
         use_operator = Operator(**operator)
         use_agent = SynodeAgent(**agent)
 
-        bot = BotFactory.summon(bot_name=use_operator.operator_path)
-        bot.timeout = use_agent.timeout
-        return asyncio.run(Synode.run_bot(operator=bot, use_input=use_input, handler=handler, instructions=instructions, content_type=content_type))
+        runtime = WorkerRuntime.current()
+        bot = _bot_operator(runtime, use_operator, use_agent)
+        return runtime.run(Synode.run_bot(operator=bot, use_input=use_input, handler=handler, instructions=instructions, content_type=content_type))
+
+
+    @tm_app.task(queue="byzantium_q")
+    def run_bot_batch(
+            operator: dict,
+            agent: dict,
+            calls: list,
+            content_type: str = "TEXT"
+    ):
+        """
+        Batched run_bot: one bot serves every call of the batch, results are returned in call order.
+        calls: [{"handler", "use_input", "instructions"}]
+        """
+        use_operator = Operator(**operator)
+        use_agent = SynodeAgent(**agent)
+
+        runtime = WorkerRuntime.current()
+        bot = _bot_operator(runtime, use_operator, use_agent)
+
+        async def run_calls():
+            results = await asyncio.gather(*[
+                Synode.run_bot(operator=bot, use_input=call.get("use_input"), handler=call.get("handler"),
+                               instructions=call.get("instructions"), content_type=content_type)
+                for call in calls
+            ], return_exceptions=True)
+            return [{} if isinstance(result, Exception) else result for result in results]
+
+        return runtime.run(run_calls())
 
 
     @tm_app.task(queue="byzantium_q")
@@ -58,11 +87,15 @@ if tm_app:
         use_operator = Operator(**operator)
         use_agent = SynodeAgent(**agent)
 
-        hydra = cast(BaseHydra,BotFactory.summon(bot_name=use_operator.operator_path))
-        hydra.timeout = use_agent.timeout
+        runtime = WorkerRuntime.current()
+        # run_hydra flushes and reuses the head, a hydra is only used by one task at a time
+        with runtime.lease("hydra", operator, lambda: BotFactory.summon(bot_name=use_operator.operator_path)) as leased:
+            hydra = cast(BaseHydra, leased)
+            hydra.timeout = use_agent.timeout
 
-        return asyncio.run(Synode.run_hydra(operator=hydra, use_input=use_input, handler=handler, instructions=instructions,
-                                          content_type=content_type,**use_agent.kwargs))
+            return runtime.run(Synode.run_hydra(operator=hydra, use_input=use_input, handler=handler,
+                                                instructions=instructions, content_type=content_type,
+                                                **use_agent.kwargs))
 
 
     @tm_app.task(queue="byzantium_q")
@@ -77,10 +110,14 @@ if tm_app:
         use_operator = Operator(**operator)
         use_agent = SynodeAgent(**agent)
 
-        SynodeFactory.load_config(use_operator.operator_path, alias=use_operator.alias)
-        synode = SynodeFactory.summon(use_operator.alias)
+        def summon():
+            SynodeFactory.load_config(use_operator.operator_path, alias=use_operator.alias)
+            return SynodeFactory.summon(use_operator.alias)
 
-        return asyncio.run(Synode.run_synode(operator=synode, use_input=use_input, handler=handler, instructions=instructions))
+        runtime = WorkerRuntime.current()
+        synode = runtime.operator("synode", operator, summon)
+
+        return runtime.run(Synode.run_synode(operator=synode, use_input=use_input, handler=handler, instructions=instructions))
 
     @tm_app.task(queue="byzantium_q")
     def run_basic(
@@ -94,31 +131,12 @@ if tm_app:
         use_operator = Operator(**operator)
         use_agent = SynodeAgent(**agent)
 
-
-        use_blackboard = None
-        if blackboard:
-            blackboard = BlackboardHandler(**blackboard)
-
-            use_blackboard = SynodeHelpers.get_class(blackboard.handler)
-
-            use_blackboard.from_dump(data=blackboard.data)
-
-        klass = SynodeHelpers.get_class(use_operator.operator_path)
-
+        runtime = WorkerRuntime.current()
         result = None
         try:
-            _kwargs = use_operator.kwargs.get("constructor", {})
-            signature = inspect.signature(klass.__init__)
-
-            # Extract parameter names, excluding 'self'
-            param_names = [param.name for param in signature.parameters.values() if param.name != 'self']
-
-            if use_blackboard and "blackboard" in param_names:
-                operator = klass(blackboard=use_blackboard, **_kwargs)
-            else:
-                operator = klass(**_kwargs)
+            operator = _basic_operator(runtime, use_operator, blackboard)
 
-            result = asyncio.run(Synode.run_basic(
+            result = runtime.run(Synode.run_basic(
                 operator=operator,
                 handler=handler,
                 use_input=use_input,
@@ -128,3 +146,71 @@ if tm_app:
             Helpers.errPrint(e, "FAILED RUN BASIC IN byzantium tasks", 171)
 
         return result
+
+    @tm_app.task(queue="byzantium_q")
+    def run_basic_batch(
+            operator: dict,
+            agent: dict,
+            calls: list,
+            blackboard: dict = None
+    ):
+        """
+        Batched run_basic: the operator and its blackboard are built once for the batch,
+        a failing call yields None like run_basic does.
+        calls: [{"handler", "use_input", "instructions"}]
+        """
+        use_operator = Operator(**operator)
+        use_agent = SynodeAgent(**agent)
+
+        runtime = WorkerRuntime.current()
+        try:
+            basic = _basic_operator(runtime, use_operator, blackboard)
+        except Exception as e:
+            Helpers.errPrint(e, "FAILED RUN BASIC BATCH IN byzantium tasks", 171)
+            return [None] * len(calls)
+
+        async def run_calls():
+            results = await asyncio.gather(*[
+                Synode.run_basic(operator=basic, handler=call.get("handler"), use_input=call.get("use_input"),
+                                 instructions=call.get("instructions"))
+                for call in calls
+            ], return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    Helpers.errPrint(result, "FAILED RUN BASIC BATCH IN byzantium tasks", 171)
+            return [None if isinstance(result, Exception) else result for result in results]
+
+        return runtime.run(run_calls())
+
+
+def _bot_operator(runtime: WorkerRuntime, use_operator: Operator, use_agent: SynodeAgent):
+    """
+    Bots are shared by concurrent tasks, the timeout is part of the cache key so a cached bot is never changed.
+    """
+    def build():
+        bot = BotFactory.summon(bot_name=use_operator.operator_path)
+        bot.timeout = use_agent.timeout
+        return bot
+
+    return runtime.operator("bot", {**use_operator.model_dump(), "timeout": use_agent.timeout}, build)
+
+
+def _basic_operator(runtime: WorkerRuntime, use_operator: Operator, blackboard: dict = None):
+    """
+    BASIC operators are cached by definition, except the ones built around the blackboard shipped with the task.
+    """
+    klass = SynodeHelpers.get_class(use_operator.operator_path)
+
+    _kwargs = use_operator.kwargs.get("constructor", {})
+    signature = inspect.signature(klass.__init__)
+
+    # Extract parameter names, excluding 'self'
+    param_names = [param.name for param in signature.parameters.values() if param.name != 'self']
+
+    if blackboard and "blackboard" in param_names:
+        handle = BlackboardHandler(**blackboard)
+        use_blackboard = SynodeHelpers.get_class(handle.handler).attach(handle)
+
+        return klass(blackboard=use_blackboard, **_kwargs)
+
+    return runtime.operator("basic", use_operator.model_dump(), lambda: klass(**_kwargs))
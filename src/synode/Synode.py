@@ -1,10 +1,11 @@
 import asyncio
 import copy
 import inspect
+import time
 
 import uuid
 from abc import ABC
-from typing import Dict, cast, Optional, Any, final, runtime_checkable, Protocol
+from typing import Dict, cast, Optional, Any, final, runtime_checkable, Protocol, Callable, Awaitable
 
 from kimera.helpers.Helpers import Helpers
 from kimllm.gpt.BaseHydra import BaseHydra
@@ -13,7 +14,6 @@ from kimera.process.TaskManager import TaskManager
 
 from .panoptes.Argus import Argus
 
-from .blackboard.Blackboard import BlackboardHandler
 from .blackboard.InMemoryBlackboard import InMemoryBlackboard
 from .helpers.Helpers import Helpers as SynodeHelpers
 
@@ -22,7 +22,16 @@ from kimllm.gpt.chat import ChatMod
 from kimllm.gpt.enums import ContentTypes, Roles
 
 from .helpers.SafeEvaluator import SafeEvaluator
-from .schematics.Enums import Signals
+from .runtime.ExecutionPlan import ExecutionPlan, OperatorRef, OpPlan, TargetPlan
+from .runtime.LaunchContext import LaunchContext
+from .runtime.Limiter import Limiter, LimiterRegistry
+from .runtime.MemoCache import MemoCache
+from .runtime.MicroBatcher import MicroBatcher
+from .runtime.OperatorRegistry import OperatorRegistry
+from .runtime.SingleFlight import SingleFlight
+from .runtime.MapExecutor import MapExecutor
+from .runtime.Reducer import Reducer
+from .schematics.Enums import Signals, MemoScopes
 from .wrappers.SynodeHydra import SynodeHydra
 
 from kimllm.gpt.BotFactory import BotFactory
@@ -47,9 +56,15 @@ class Synode(ABC):
 
     def __init__(self, config,persistence_key=None):
         from .schematics.SynodeConfig import SynodeConfig
+        started = time.perf_counter()
+        self._startup: Dict[str, Any] = {}
         self.synode: SynodeConfig = config
+        # identifies the board in memo / single flight keys of BASIC operators built on it
+        self._board_id = uuid.uuid4().hex
+        self._board_bound = set()
         if self.synode.blackboard:
-            bb_kwargs = self.synode.blackboard.kwargs
+            # the config may be shared with other instances, the namespace suffix is ours only
+            bb_kwargs = dict(self.synode.blackboard.kwargs)
             self._persist = None
             if bb_kwargs.get("namespace"):
                 if not self.synode.persistent:
@@ -57,6 +72,7 @@ class Synode(ABC):
                 elif self.synode.persistent:
                     bb_kwargs["namespace"] += persistence_key
                     self._persist = persistence_key
+                    self._board_id = bb_kwargs["namespace"]
 
             Helpers.sysPrint("BBLOARARD",bb_kwargs)
             self._blackboard = self.synode.blackboard.blackboard_module(**bb_kwargs)
@@ -66,18 +82,65 @@ class Synode(ABC):
         else:
             self._blackboard = None
 
-        self._async_callback = None
-        if self.synode.async_callback:
-            self._async_callback = SynodeHelpers.get_method(self, self.synode.async_callback)
-
-        self._operators: Dict[str, Any] = {}
+        self._operators = OperatorRegistry(resolve=lambda alias: self.synode.get_operator(alias),
+                                           build=self._build_operator,
+                                           aliases=lambda: [operator.alias for operator in self.synode.operators])
+        self._init_runtime()
+        operators_started = time.perf_counter()
         self._load_operators()
+        self._startup["warm_operators"] = time.perf_counter() - operators_started
         self._main_input = None
-        self._loops: Dict[str, int] = {}
+        self._default_context = LaunchContext(owner=self)
+        self._active_launches = 0
+        self._pool_name: Optional[str] = None
+        self._config_name: str = self.synode.name
         self._hook: Optional[HookCallable] = self.__hook__
-        self._task_bucket = []
         self._evaluator = SafeEvaluator(self._blackboard)
         self._init_blackboard()
+        self._startup["init"] = time.perf_counter() - started
+
+    def _init_runtime(self):
+        """
+        State derived from the config that adopt() rebuilds on a reload.
+        """
+        self._async_callback = None
+        if self.synode.async_callback:
+            self._async_callback = SynodeHelpers.get_method(self, self.synode.async_callback)
+
+        self._limiters = LimiterRegistry(global_limit=self.synode.semaphore)
+        self._memo: Dict[str, MemoCache] = {}
+        self._batchers: Dict[tuple, MicroBatcher] = {}
+        self._single_flight: Optional[SingleFlight] = None
+        if self.synode.single_flight == MemoScopes.PROCESS:
+            self._single_flight = SingleFlight.shared()
+        elif self.synode.single_flight == MemoScopes.SYNODE:
+            self._single_flight = SingleFlight()
+
+    def adopt(self, config, is_current: Optional[Callable[[Any], bool]] = None) -> bool:
+        """
+        Moves an idle instance onto a reloaded config. Built operators whose definition did not change are kept,
+        the others are dropped and rebuilt on first use. is_current(instance) may veto keeping an operator
+        (nested synods on an outdated config).
+        Returns False when the instance cannot adopt it (running launches, different blackboard or persistence),
+        the caller should summon a new instance instead.
+        """
+        if self._active_launches:
+            return False
+        if config.blackboard != self.synode.blackboard or config.persistent != self.synode.persistent:
+            return False
+
+        previous = self.synode
+        self.synode = config
+        for alias, instance in self._operators.built.items():
+            definition = config.get_operator(alias)
+            if definition is None or definition != previous.get_operator(alias) \
+                    or (is_current and not is_current(instance)):
+                self._operators.discard(alias)
+
+        self._init_runtime()
+        self._init_blackboard()
+        self._load_operators()
+        return True
 
     def _init_private_board(self, private_board: InMemoryBlackboard, session=None):
         if not session:
@@ -86,18 +149,20 @@ class Synode(ABC):
         for key, value in session.items():
             private_board.set(key, value)
 
+        # defaults live on the shared config, !ref list / set / queue values are extended in place by set()
         for agent in self.synode.synode:
             if agent.store_key and agent.store_key.startswith("_"):
-                private_board.set_default(agent.store_key, agent.default_value)
+                private_board.set_default(agent.store_key, copy.deepcopy(agent.default_value))
 
             for op in agent.operations:
                 if op.store_key and op.store_key.startswith("_"):
-                    private_board.set_default(op.store_key, op.default_value)
+                    private_board.set_default(op.store_key, copy.deepcopy(op.default_value))
 
     def _init_blackboard(self):
         """
         Initializes the blackboard by setting store_key/default_value
         found in the agents and operations inside self.synode config.
+        Defaults are copied, the config is shared by every instance.
         """
         if not self._blackboard:
             return
@@ -105,12 +170,14 @@ class Synode(ABC):
         for agent in self.synode.synode:
             if agent.store_key and not agent.store_key.startswith("_"):
                 use_value = self._blackboard.get(agent.store_key)
-                self._blackboard.set(agent.store_key, use_value if use_value is not None else agent.default_value)
+                self._blackboard.set(agent.store_key,
+                                     use_value if use_value is not None else copy.deepcopy(agent.default_value))
 
             for op in agent.operations:
                 if op.store_key and not op.store_key.startswith("_"):
                     use_value = self._blackboard.get(agent.store_key)
-                    self._blackboard.set(op.store_key, use_value if use_value is not None else op.default_value)
+                    self._blackboard.set(op.store_key,
+                                         use_value if use_value is not None else copy.deepcopy(op.default_value))
 
     def set_streamer(self, operator_name, streamer):
         op = self._operators.get(operator_name, None)
@@ -123,24 +190,31 @@ class Synode(ABC):
             raise Exception(f"Operator {operator_name} does not support streaming")
 
     def _get_list_operator(self, alias):
-        return next((item for item in self.synode.operators if item.alias == alias))
+        return self.synode.get_operator(alias)
+
+    @property
+    def _context(self) -> LaunchContext:
+        """
+        The launch this code runs under, or the instance default when run_agent is called outside launch().
+        """
+        context = LaunchContext.current()
+        if context is None or context.owner is not self:
+            return self._default_context
+        return context
+
+    @property
+    def _loops(self) -> Dict[str, int]:
+        return self._context.loops
+
+    @property
+    def _task_bucket(self) -> list:
+        return self._context.tasks
 
     async def _clear_task_bucket(self):
-        for task in self._task_bucket:
-            if not task.done():
-                task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                # Swallow it—expected during shutdown
-                pass
-            except Exception as e:
-                # Log or handle unexpected exceptions
-                print(f"[Cleanup] Unexpected exception: {e}")
-        self._task_bucket.clear()
+        await self._context.clear_tasks()
 
     def _add_operator(self, operator: 'SynodeOperator'):
-        self.synode.operators.append(operator)
+        self.synode.add_operator(operator)
         self._set_operator(operator=operator)
 
     def done_callback(self, task):
@@ -160,11 +234,34 @@ class Synode(ABC):
         if not self._persist or erase:
             Helpers.sysPrint("clearing",'blackboard')
             self._blackboard.clear(True)
+        elif self._blackboard:
+            self._blackboard.flush()
+
+
 
+    def reset(self):
+        """
+        Called by SynodePool.release before an instance is reused: drops the state left by previous launches,
+        a non persistent blackboard is cleared and re-seeded with its defaults.
+        Subclasses keeping their own per-use state should extend it.
+        """
+        for task in self._default_context.tasks:
+            if not task.done():
+                task.cancel()
+        self._default_context = LaunchContext(owner=self)
+        self._main_input = None
 
+        if self._blackboard and not self.synode.persistent:
+            self._blackboard.clear()
+            self._init_blackboard()
 
     @final
-    async def launch(self, trigger="main", use_input="", session=None, *args, **kwargs):
+    async def launch(self, trigger="main", use_input="", session=None, *args, timeout: Optional[float] = None,
+                     **kwargs):
+        """
+        Every launch runs in its own LaunchContext, so one instance can serve concurrent launches.
+        timeout bounds the whole launch.
+        """
         if not session:
             session = {}
 
@@ -172,18 +269,29 @@ class Synode(ABC):
         if isinstance(session, dict):
             self._init_private_board(private_board=private_board, session=session)
 
-        result = await self._run(trigger, use_input=use_input, private_board=private_board, *args, **kwargs)
-
-        if not self.synode.persistent and self.blackboard:
-            Helpers.sysPrint("IS NOT PERSISTENT", self.synode.name)
-            self.blackboard.clear()
-
-
-        private_board.clear()
-
-        del private_board
+        context = LaunchContext(owner=self, private_board=private_board, timeout=timeout)
+        token = context.activate()
+        self._active_launches += 1
+        try:
+            run = self._run(trigger, use_input=use_input, private_board=private_board, *args, **kwargs)
+            if context.deadline is not None:
+                run = asyncio.wait_for(run, timeout=context.remaining())
+            result = await run
+        finally:
+            self._active_launches -= 1
+            # a non persistent blackboard is shared by the concurrent launches, the last one out clears it
+            if not self.synode.persistent and self.blackboard and self._active_launches == 0:
+                Helpers.sysPrint("IS NOT PERSISTENT", self.synode.name)
+                await self.blackboard.aclear()
+            elif self.blackboard:
+                # write-behind boards hold the launch's store_key writes until flushed
+                await self.blackboard.aflush()
+
+            private_board.clear()
+
+            await context.clear_tasks()
+            LaunchContext.restore(token)
 
-        await self._clear_task_bucket()
         return result
 
     @final
@@ -218,13 +326,77 @@ class Synode(ABC):
     def blackboard(self):
         return self._blackboard
 
-    def _get_agent(self, agent, private_board: Optional[InMemoryBlackboard] = None, input_dict=None):
+    @property
+    def limiters(self) -> LimiterRegistry:
+        return self._limiters
+
+    def startup_report(self) -> Dict[str, Any]:
+        """
+        Seconds spent building this instance: config (validation / overlay in SynodeFactory.summon),
+        init (the whole constructor, warm_operators included) and the build time of every operator built so far,
+        lazily built ones included.
+        """
+        operators = dict(self._operators.build_times)
+        return {
+            **self._startup,
+            "operators": operators,
+            "total": self._startup.get("config", 0) + self._startup.get("init", 0)
+                     + sum(operators.values()) - self._startup.get("warm_operators", 0),
+        }
+
+    @property
+    def operators(self) -> OperatorRegistry:
+        return self._operators
+
+    @property
+    def single_flight(self) -> Optional[SingleFlight]:
+        return self._single_flight
+
+    def memo_stats(self) -> Dict[str, dict]:
+        return {name: memo.stats() for name, memo in self._memo.items()}
+
+    def _memo_for(self, agent: "SynodeAgent") -> Optional[MemoCache]:
+        if agent.cache is None:
+            return None
+        memo = self._memo.get(agent.agent)
+        if memo is None:
+            memo = self._memo[agent.agent] = MemoCache.from_config(agent.cache)
+        return memo
+
+    def _operator_identity(self, check_operator: "Operator") -> tuple:
+        """
+        Operator part of memo and single flight keys, shared caches see operators of other synods under the same alias.
+        BASIC operators built with blackboard= answer from that board, so it is part of their identity.
+        """
+        board = self._board_id if check_operator.operator_path in self._board_bound else None
+        return check_operator.operator_type.value, check_operator.operator_path, check_operator.kwargs, board
+
+    @staticmethod
+    def _key_kwargs(kwargs: dict) -> dict:
+        """
+        Dispatch kwargs part of memo and single flight keys (op kwargs, session), the private board and other
+        runtime objects are left out.
+        """
+        return {key: value for key, value in kwargs.items()
+                if key != "private_board" and isinstance(value, (str, int, float, bool, list, tuple, dict, set,
+                                                                 type(None)))}
+
+    async def _aget_agent(self, agent, private_board: Optional[InMemoryBlackboard] = None, input_dict=None):
         if not private_board:
             private_board = None
 
-        use_agent = self._evaluator.eval(expression=agent, private_board=private_board, input_dict=input_dict)
+        use_agent = await self._evaluator.aeval(expression=agent, private_board=private_board, input_dict=input_dict)
 
-        return next((item for item in self.synode.synode if item.agent == use_agent))
+        target = self.synode.get_agent(use_agent)
+        if target is None:
+            raise Exception(f"{use_agent} does not exist on {self.synode.name}")
+        return target
+
+    async def _atarget_agent(self, target: TargetPlan, private_board: Optional[InMemoryBlackboard] = None,
+                             input_dict=None):
+        if target.agent is not None:
+            return target.agent
+        return await self._aget_agent(target.expression, private_board=private_board, input_dict=input_dict)
 
     @staticmethod
     async def run_bot(operator: BaseGPT, use_input, handler=None, instructions=None,semaphore=30, content_type: str = "TEXT", *args,
@@ -330,26 +502,213 @@ class Synode(ABC):
 
     @staticmethod
     async def run_basic(operator, handler: str, use_input, instructions=None, *args, **kwargs):
-        async with asyncio.Semaphore(100):
-            if hasattr(operator, handler):
-                method = getattr(operator, handler)
-                if callable(method):
-                    result = await method(**use_input)  # Call the method
-                    return result
-                else:
-                    print(f"Attribute '{method}' exists but is not callable.")
+        if hasattr(operator, handler):
+            method = getattr(operator, handler)
+            if callable(method):
+                result = await method(**use_input)  # Call the method
+                return result
             else:
-                print(f"Method '{handler}' not found on {operator.__class__.__name__}.")
+                print(f"Attribute '{method}' exists but is not callable.")
+        else:
+            print(f"Method '{handler}' not found on {operator.__class__.__name__}.")
+
+    async def _dispatch(self, agent: "SynodeAgent", check_operator: "Operator", operator, handler, use_input,
+                        agent_instructions, dispatch: Optional[str] = None, *args, **kwargs):
+        """
+        Routes one operator call to the _dispatch_<type> method chosen by the execution plan,
+        or by the operator type when the operator was only known at runtime.
+        """
+        if dispatch is None:
+            dispatch = ExecutionPlan.DISPATCHERS.get(check_operator.operator_type)
+        if dispatch is None:
+            raise Exception("Wrong agent config (bot or synode only)")
+
+        return await getattr(self, dispatch)(agent, check_operator, operator, handler, use_input,
+                                             agent_instructions, *args, **kwargs)
+
+    def _batcher_for(self, task_name: str, agent: "SynodeAgent", check_operator: "Operator",
+                     payload: Callable[[], Awaitable[dict]]) -> MicroBatcher:
+        """
+        Remote batches of one agent / operator pair. payload coroutine builds the per batch task kwargs,
+        the operator and agent definitions travel once per batch instead of once per item.
+        A batcher left by another event loop is replaced.
+        """
+        key = (task_name, agent.agent, check_operator.alias)
+        batcher = self._batchers.get(key)
+        if batcher is None or not batcher.bound_to(asyncio.get_running_loop()):
+            async def send(calls: list) -> list:
+                return await TaskManager().send_await(task_name=task_name, friend='byzantium', kwargs={
+                    **(await payload()),
+                    "calls": calls,
+                }, timeout=agent.timeout + 5)
+
+            batcher = self._batchers[key] = MicroBatcher(send=send, batch_size=agent.batch_size,
+                                                         linger=agent.batch_linger)
+        return batcher
+
+    def batch_stats(self) -> Dict[str, dict]:
+        return {f"{task}:{agent}:{alias}": batcher.stats()
+                for (task, agent, alias), batcher in self._batchers.items()}
+
+    async def _dispatch_hydra(self, agent: "SynodeAgent", check_operator: "Operator", operator, handler, use_input,
+                              agent_instructions, *args, **kwargs):
+        private_board: Optional[InMemoryBlackboard] = kwargs.get("private_board", None)
+        if not handler:
+            handler = "main"
+
+        if agent.run_async:
+            return await TaskManager().send_await(task_name="run_hydra", friend='byzantium', kwargs={
+                "operator": check_operator.model_dump(),
+                "agent": agent.model_dump(),
+                "handler": handler,
+                "use_input": use_input,
+                "instructions": agent_instructions,
+                **agent.kwargs
+            }, timeout=agent.timeout + 5)
+
+        result = await self.run_hydra(operator=operator,
+                                      handler=handler,
+                                      use_input=use_input,
+                                      instructions=agent_instructions,
+                                      session=private_board.dump(),
+                                      **agent.kwargs
+                                      )
+
+        if isinstance(result, dict) and result.get("sys_prompt", None):
+            from .schematics.SynodeConfig import OperatorHandler
+            new_head = result
+
+            head_name = new_head.get("head_name", uuid.uuid4().hex[:8])
+            head_kwargs = {
+                "sys_prompt": f"HEAD NAME: [{head_name}] " + new_head.get("sys_prompt"),
+                "tools": new_head.get("tools", []),
+                "description": new_head.get("instructions", "spawned head"),
+            }
+
+            h_handler = OperatorHandler(kwargs=head_kwargs)
+
+            self.synode.set_operator_handler(check_operator.alias, head_name, h_handler)
+            operator.spawn(head_name=new_head.get("head_name"), **h_handler.kwargs)
+
+            result = {
+                "head_name": head_name,
+                "instructions": new_head.get("instructions"),
+            }
+
+        return result
+
+    async def _dispatch_synode(self, agent: "SynodeAgent", check_operator: "Operator", operator, handler, use_input,
+                               agent_instructions, *args, **kwargs):
+        if not handler:
+            handler = "main"
+
+        if agent.run_async:
+            return await TaskManager().send_await(task_name="run_synode", friend='byzantium', kwargs={
+                "operator": check_operator.model_dump(),
+                "agent": agent.model_dump(),
+                "handler": handler,
+                "use_input": use_input,
+                "instructions": agent_instructions
+            }, timeout=agent.timeout + 5)
+
+        return await self.run_synode(operator=operator,
+                                     handler=handler,
+                                     use_input=use_input,
+                                     instructions=agent_instructions)
+
+    async def _dispatch_argus(self, agent: "SynodeAgent", check_operator: "Operator", operator, handler, use_input,
+                              agent_instructions, *args, **kwargs):
+        if not handler:
+            handler = "main"
+
+        return await self.run_argus(operator=operator,
+                                    handler=handler,
+                                    use_input=use_input,
+                                    instructions=agent_instructions)
+
+    async def _dispatch_bot(self, agent: "SynodeAgent", check_operator: "Operator", operator, handler, use_input,
+                            agent_instructions, *args, **kwargs):
+        private_board: Optional[InMemoryBlackboard] = kwargs.get("private_board", None)
+
+        if agent.run_async and agent.batch_size:
+            async def payload():
+                return {
+                    "operator": check_operator.model_dump(),
+                    "agent": agent.model_dump(),
+                }
+
+            batcher = self._batcher_for("run_bot_batch", agent, check_operator, payload)
+            return await batcher.submit({
+                "handler": handler,
+                "use_input": use_input,
+                "instructions": agent_instructions
+            })
+
+        if agent.run_async:
+            return await TaskManager().send_await(task_name="run_bot", friend='byzantium', kwargs={
+                "operator": check_operator.model_dump(),
+                "agent": agent.model_dump(),
+                "handler": handler,
+                "use_input": use_input,
+                "instructions": agent_instructions
+            }, timeout=agent.timeout + 5)
+
+        return await self.run_bot(operator=operator,
+                                  handler=handler,
+                                  use_input=use_input,
+                                  instructions=agent_instructions,
+                                  session=private_board.dump()
+                                  )
+
+    async def _board_handle(self) -> Optional[dict]:
+        if not self._blackboard:
+            return None
+        return (await self._blackboard.ahandle()).model_dump()
+
+    async def _dispatch_basic(self, agent: "SynodeAgent", check_operator: "Operator", operator, handler, use_input,
+                              agent_instructions, *args, **kwargs):
+        _kwargs = {**check_operator.kwargs.get(handler, {}), "use_input": use_input, **kwargs}
+        if agent.run_async and agent.batch_size:
+            # the blackboard handle is taken once per batch, when the batch leaves
+            async def payload():
+                return {
+                    "operator": check_operator.model_dump(),
+                    "agent": agent.model_dump(),
+                    "blackboard": await self._board_handle()
+                }
+
+            batcher = self._batcher_for("run_basic_batch", agent, check_operator, payload)
+            return await batcher.submit({
+                "handler": handler,
+                "use_input": _kwargs,
+                "instructions": agent_instructions
+            })
+
+        if agent.run_async:
+            return await TaskManager().send_await(task_name="run_basic", friend='byzantium', kwargs={
+                "operator": check_operator.model_dump(),
+                "agent": agent.model_dump(),
+                "handler": handler,
+                "use_input": _kwargs,
+                "instructions": agent_instructions,
+                "blackboard": await self._board_handle()
+            }, timeout=agent.timeout)
+
+        return await Synode.run_basic(operator=operator, handler=handler, use_input=_kwargs,
+                                      instructions=agent_instructions, *args, **kwargs)
 
     async def run_agent(self, agent: "SynodeAgent", use_input=None,semaphore=None,
-                        *args, **kwargs):
+                        limit_scope: Optional[Limiter] = None, *args, **kwargs):
+        """
+        semaphore overrides agent.semaphore when the agent limiter is first created,
+        limit_scope is the budget of the closest enclosing operation that set its own semaphore.
+        """
         if semaphore is None:
             semaphore = agent.semaphore
 
-
-
-        from .schematics.SynodeConfig import SynodeOp, SynodeOpType, OperatorTypes
-        private_board: Optional[InMemoryBlackboard] = None
+        from .schematics.SynodeConfig import SynodeOp, SynodeOpType
+        plan = self.synode.plan.for_agent(agent)
+        private_board: Optional[InMemoryBlackboard] = self._context.private_board
 
         if kwargs.get("private_board", None):
             private_board: InMemoryBlackboard = kwargs.get("private_board")
@@ -366,147 +725,55 @@ class Synode(ABC):
         if isinstance(use_input, Signals):
             return use_input
 
-        use_operator = self._evaluator.eval(agent.operator.replace("@", "\n"), private_board=private_board,
-                                            input_dict=use_input).replace("\n", "@")
-        Helpers.sysPrint("USE_OPERATOR",use_operator)
-        parts = use_operator.split("::")
-        handler = parts[1] if len(parts) > 1 else None
+        use_operator = plan.operator_ref
+        if use_operator is None:
+            use_operator = OperatorRef((await self._evaluator.arender(plan.operator, private_board=private_board,
+                                                                      input_dict=use_input)).replace("\n", "@"))
+        handler = use_operator.handler
 
-        operator = self._operators[parts[0]]
-        check_operator = self._get_list_operator(parts[0])
+        operator = self._operators[use_operator.alias]
+        check_operator = self._get_list_operator(use_operator.alias)
 
         agent_instructions = agent.instructions
 
         if self._blackboard:
-            agent_instructions = self._evaluator.eval(agent_instructions, private_board=private_board,
-                                                      input_dict=use_input)
-
-        operator.timeout = agent.timeout
-        if check_operator.operator_type == OperatorTypes.HYDRA:
-            if not handler:
-                handler = "main"
-
-            if agent.run_async:
-                result = await TaskManager().send_await(task_name="run_hydra", friend='byzantium', kwargs={
-                    "operator": check_operator.model_dump(),
-                    "agent": agent.model_dump(),
-                    "handler": handler,
-                    "use_input": use_input,
-                    "instructions": agent_instructions,
-                    **agent.kwargs
-                }, timeout=agent.timeout + 5)
-
-            else:
-                async with asyncio.Semaphore(semaphore):
-                    result = await self.run_hydra(operator=operator,
-                                                  handler=handler,
-                                                  use_input=use_input,
-                                                  instructions=agent_instructions,
-                                                  session=private_board.dump(),
-                                                  **agent.kwargs
-                                                  )
-
-                if isinstance(result, dict) and result.get("sys_prompt", None):
-                    from .schematics.SynodeConfig import OperatorHandler
-                    new_head = result
-
-                    head_name = new_head.get("head_name", uuid.uuid4().hex[:8])
-                    head_kwargs = {
-                        "sys_prompt": f"HEAD NAME: [{head_name}] " + new_head.get("sys_prompt"),
-                        "tools": new_head.get("tools", []),
-                        "description": new_head.get("instructions", "spawned head"),
-                    }
-
-                    h_handler = OperatorHandler(kwargs=head_kwargs)
-
-                    check_operator.handlers[head_name] = h_handler
-                    operator.spawn(head_name=new_head.get("head_name"), **h_handler.kwargs)
-
-                    result = {
-                        "head_name": head_name,
-                        "instructions": new_head.get("instructions"),
-                    }
-
-
-        elif check_operator.operator_type == OperatorTypes.SYNOD:
-            if not handler:
-                handler = "main"
-
-            if agent.run_async:
-                result = await TaskManager().send_await(task_name="run_synode", friend='byzantium', kwargs={
-                    "operator": check_operator.model_dump(),
-                    "agent": agent.model_dump(),
-                    "handler": handler,
-                    "use_input": use_input,
-                    "instructions": agent_instructions
-                }, timeout=agent.timeout + 5)
-
-            else:
-                async with asyncio.Semaphore(semaphore):
-                    result = await self.run_synode(operator=operator,
-                                                   handler=handler,
-                                                   use_input=use_input,
-                                                   instructions=agent_instructions)
-
-
-        elif check_operator.operator_type == OperatorTypes.ARGUS:
-            if not handler:
-                handler = "main"
-
-            result = await self.run_argus(operator=operator,
-                                          handler=handler,
-                                          use_input=use_input,
-                                          instructions=agent_instructions)
-
-        elif check_operator.operator_type == OperatorTypes.BOT:
-
-            if agent.run_async:
-                #
-                result = await TaskManager().send_await(task_name="run_bot", friend='byzantium', kwargs={
-                    "operator": check_operator.model_dump(),
-                    "agent": agent.model_dump(),
-                    "handler": handler,
-                    "use_input": use_input,
-                    "instructions": agent_instructions
-                }, timeout=agent.timeout + 5)
+            agent_instructions = await self._evaluator.arender(plan.instructions, private_board=private_board,
+                                                               input_dict=use_input)
+
+        memo = self._memo_for(agent)
+        memo_key = None
+        cached = False
+        if memo is not None:
+            memo_key = MemoCache.make_key(self._operator_identity(check_operator), handler, agent_instructions,
+                                          use_input, self._key_kwargs(kwargs))
+            cached, result = await memo.aget(memo_key)
+
+        if not cached:
+            async def call():
+                operator.timeout = agent.timeout
+                limiters = self._limiters.for_dispatch(agent=agent.agent, agent_limit=semaphore,
+                                                       operator=check_operator.alias,
+                                                       operator_limit=check_operator.semaphore,
+                                                       scope=limit_scope)
+                async with self._limiters.hold(*limiters):
+                    return await self._dispatch(agent=agent, check_operator=check_operator, operator=operator,
+                                                handler=handler, use_input=use_input,
+                                                agent_instructions=agent_instructions, dispatch=plan.dispatch,
+                                                *args, **kwargs)
+
+            if self._single_flight is not None:
+                flight_key = memo_key or MemoCache.make_key(self._operator_identity(check_operator), handler,
+                                                            agent_instructions, use_input, self._key_kwargs(kwargs))
+                result = await self._single_flight.do(flight_key, call)
             else:
+                result = await call()
 
-                async with asyncio.Semaphore(semaphore):
-                    result = await self.run_bot(operator=operator,
-                                                handler=handler,
-                                                use_input=use_input,
-                                                instructions=agent_instructions,
-                                                session=private_board.dump()
-                                                )
-
-        elif check_operator.operator_type == OperatorTypes.BASIC:
-            _kwargs = check_operator.kwargs.get(handler, {})
-            _kwargs["use_input"] = use_input
-            _kwargs = {**_kwargs, **kwargs}
-            if agent.run_async:
-                result = await TaskManager().send_await(task_name="run_basic", friend='byzantium', kwargs={
-                    "operator": check_operator.model_dump(),
-                    "agent": agent.model_dump(),
-                    "handler": handler,
-                    "use_input": _kwargs,
-                    "instructions": agent_instructions,
-                    "blackboard": BlackboardHandler(
-                        handler=self.synode.blackboard.__module__,
-                        data=self._blackboard.full_dump()
-                    ).model_dump()
-                }, timeout=agent.timeout)
-            else:
-                async with asyncio.Semaphore(semaphore):
-                    result = await Synode.run_basic(operator=operator, handler=handler, use_input=_kwargs,
-                                                    instructions=agent_instructions, *args, **kwargs)
-        else:
-            raise Exception("Wrong agent config (bot or synode only)")
+            # run_bot reports failures as {} and missing BASIC handlers return None, neither is memoized
+            if memo is not None and result not in (None, {}):
+                await memo.aset(memo_key, result)
 
-        if self._blackboard and agent.store_key:
-            if agent.store_key.startswith("_"):
-                private_board.set(agent.store_key, result)
-            else:
-                self._blackboard.set(agent.store_key, result)
+        if agent.store_key:
+            await self._astore_result(agent.store_key, result, private_board=private_board)
 
         if self._hook:
             self._task_bucket.append(asyncio.create_task(self._hook(self, action="output", agent=agent, data=result)))
@@ -514,9 +781,11 @@ class Synode(ABC):
         if isinstance(result, Signals):
             return use_input
 
-        for _op in agent.operations:
-            op: SynodeOp = cast(SynodeOp, _op)
-            semaphore = agent.semaphore if not op.semaphore else op.semaphore
+        for op_plan in plan.operations:
+            op: SynodeOp = cast(SynodeOp, op_plan.op)
+            scope = limit_scope
+            if op.semaphore:
+                scope = self._limiters.limiter(op_plan.scope_key, op.semaphore)
 
             if self._hook:
                 self._task_bucket.append(
@@ -532,46 +801,48 @@ class Synode(ABC):
 
             if op.op_type == SynodeOpType.CHAIN_TO:
 
-                target = self._get_agent(
-                    self._evaluator.eval(op.target, private_board=private_board, input_dict=result))
+                target = op_plan.target.agent or await self._aget_agent(
+                    await self._evaluator.arender(op_plan.target.template, private_board=private_board,
+                                                  input_dict=result))
                 if target:
                     print({**kwargs, **op.kwargs})
 
-                    result = await self.run_agent(agent=target, use_input=result,semaphore=semaphore, *args, **{**kwargs, **op.kwargs})
+                    result = await self.run_agent(agent=target, use_input=result,limit_scope=scope, *args, **{**kwargs, **op.kwargs})
                 else:
                     raise Exception(f"{target} does not exist on {self.synode.name}")
             elif op.op_type == SynodeOpType.LOOP_TO:
                 max_cycles = op.kwargs.get("max_cycles", 1)
-                _condition = op.kwargs.get("condition", "`true`")
 
-                _condition = self._evaluator.eval(_condition, private_board=private_board, input_dict=result)
+                _condition = await self._evaluator.arender(op_plan.condition, private_board=private_board,
+                                                           input_dict=result)
 
                 if agent.agent not in self._loops:
                     self._loops[agent.agent] = 0
 
                 if self._loops[agent.agent] < max_cycles and _condition:
-                    target = self._get_agent(op.target, private_board=private_board, input_dict=use_input)
+                    target = await self._atarget_agent(op_plan.target, private_board=private_board,
+                                                       input_dict=use_input)
 
                     self._loops[agent.agent] += 1
 
-                    result = await self.run_agent(agent=target, use_input=result,semaphore=semaphore, *args, **kwargs)
+                    result = await self.run_agent(agent=target, use_input=result,limit_scope=scope, *args, **kwargs)
 
             elif op.op_type == SynodeOpType.FORK_TO:
                 task_list = []
-                re_target = op.target
+                re_target = op_plan.targets
 
-                if isinstance(op.target,str):
-                    re_target = self._evaluator.eval(expression=op.target, private_board=private_board, input_dict={'items':result})
+                if op_plan.target is not None:
+                    re_target = await self._evaluator.arender(op_plan.target.template, private_board=private_board,
+                                                              input_dict={'items': result})
+                    re_target = [TargetPlan(target, self.synode) for target in re_target]
 
-                Helpers.print({"x":re_target})
                 for target in re_target:
-                    Helpers.sysPrint("TARGET",target)
-                    use_target = self._get_agent(target, private_board=private_board, input_dict=result)
+                    use_target = await self._atarget_agent(target, private_board=private_board, input_dict=result)
                     pass_result = result
                     if not op.kwargs.get("keep_object",False):
                         pass_result = copy.copy(result)
                     task_list.append(
-                        asyncio.create_task(self.run_agent(agent=use_target, use_input=pass_result,semaphore=semaphore,
+                        asyncio.create_task(self.run_agent(agent=use_target, use_input=pass_result,limit_scope=scope,
                                                            *args, **kwargs)))
 
                 result = await asyncio.gather(*task_list)
@@ -582,41 +853,34 @@ class Synode(ABC):
                 if not isinstance(result, list):
                     raise Exception("MAP requires an array")
 
-                task_list = []
-                for part in result:
-                    use_target = self._get_agent(op.target, private_board=private_board, input_dict=part)
-                    Helpers.sysPrint("use_target",use_target)
-                    task_list.append(
-                        asyncio.create_task(self.run_agent(agent=use_target, use_input=part, semaphore=semaphore,
-                                                           *args, **kwargs)))
-
-                    result = await asyncio.gather(*task_list)
-
-                if op.op_type == SynodeOpType.FILTER:
-                    result = [part for part in result if part not in (False, None)]
+                result = await self._run_map(agent=agent, op_plan=op_plan, items=result, limit_scope=scope,
+                                             *args, **kwargs)
 
             elif op.op_type == SynodeOpType.REDUCE:
                 if not isinstance(result, list):
                     raise Exception("REDUCE requires an array")
-                accumulate = op.kwargs.get("accumulator")
-                for part in result:
-                    use_target = self._get_agent(op.target, private_board=private_board, input_dict=part)
-                    accumulate = await self.run_agent(agent=use_target,
-                                                      use_input={"accumulate": accumulate, "item": part},
-                                                      semaphore=semaphore,
-                                                      *args,
-                                                      **kwargs)
 
-                result = accumulate
+                async def step(payload, part):
+                    use_target = await self._atarget_agent(op_plan.target, private_board=private_board,
+                                                           input_dict=part)
+                    return await self.run_agent(agent=use_target,
+                                                use_input=payload,
+                                                limit_scope=scope,
+                                                *args,
+                                                **kwargs)
+
+                reducer = Reducer(step=step,
+                                  max_in_flight=op.kwargs.get("max_in_flight", op.semaphore or agent.semaphore),
+                                  chunk_size=op.kwargs.get("chunk_size", 10))
+                result = await reducer.reduce(result,
+                                              accumulator=op.kwargs.get("accumulator"),
+                                              mode=op.kwargs.get("mode", Reducer.SEQUENTIAL))
 
             if isinstance(result, Signals):
                 return use_input
 
-            if self._blackboard and op.store_key:
-                if op.store_key.startswith("_"):
-                    private_board.set(op.store_key, result)
-                else:
-                    self._blackboard.set(op.store_key, result)
+            if op.store_key and not op_plan.stream:
+                await self._astore_result(op.store_key, result, private_board=private_board)
 
             if self._hook:
                 self._task_bucket.append(
@@ -640,19 +904,60 @@ class Synode(ABC):
 
         return result
 
-    def _load_operators(self):
+    async def _astore_result(self, store_key: str, value, private_board: Optional[InMemoryBlackboard] = None):
+        if not self._blackboard:
+            return
+
+        if store_key.startswith("_"):
+            private_board.set(store_key, value)
+        else:
+            await self._blackboard.aset(store_key, value)
+
+    async def _run_map(self, agent: "SynodeAgent", op_plan: OpPlan, items: list,
+                       limit_scope: Optional[Limiter] = None, *args, **kwargs):
+        """
+        MAP / FILTER over items with at most op.kwargs["max_in_flight"] agents running
+        (defaults to the op or agent semaphore). With op.kwargs["stream_store"] every result is
+        appended to op.store_key as it arrives, meant for !ref list / set / queue keys.
+        """
+        from .schematics.SynodeConfig import SynodeOpType
+        private_board: Optional[InMemoryBlackboard] = kwargs.get("private_board", None)
+        op = op_plan.op
+
+        async def worker(part):
+            use_target = await self._atarget_agent(op_plan.target, private_board=private_board, input_dict=part)
+            return await self.run_agent(agent=use_target, use_input=part, limit_scope=limit_scope, *args, **kwargs)
+
+        keep = None
+        if op.op_type == SynodeOpType.FILTER:
+            def keep(part):
+                return part not in (False, None)
 
-        for operator in self.synode.operators:
-            self._set_operator(operator)
+        on_result = None
+        if op_plan.stream:
+            async def on_result(index, value):
+                await self._astore_result(op.store_key, [value], private_board=private_board)
+
+        executor = MapExecutor(max_in_flight=op.kwargs.get("max_in_flight", op.semaphore or agent.semaphore))
+        return await executor.run(items, worker, keep=keep, on_result=on_result)
+
+    def _load_operators(self):
+        """
+        Operators are built on first use, only the ones listed in the config warm_operators ("*" for all) are built now.
+        """
+        warm = self.synode.warm_operators
+        if warm:
+            self._operators.warm(None if "*" in warm else warm)
 
     def _set_operator(self, operator):
+        self._operators.set(operator.alias, self._build_operator(operator))
+
+    def _build_operator(self, operator):
         from .SynodeFactory import SynodeFactory
         from .schematics.SynodeConfig import OperatorTypes
 
         if operator.operator_type == OperatorTypes.ARGUS:
-            argus = SynodeFactory.summon_argus(self, argus_path=operator.operator_path)
-
-            self._operators[operator.alias] = argus
+            return SynodeFactory.summon_argus(self, argus_path=operator.operator_path)
 
         if operator.operator_type == OperatorTypes.HYDRA:
             hydra = cast(SynodeHydra, BotFactory.summon(bot_name=operator.operator_path))
@@ -665,16 +970,15 @@ class Synode(ABC):
                 else:
                     hydra.spawn(head_name=head, **definition.kwargs)
 
-            self._operators[operator.alias] = hydra
+            return hydra
 
         elif operator.operator_type == OperatorTypes.BOT:
             print(operator.operator_path)
-            self._operators[operator.alias] = BotFactory.summon(bot_name=operator.operator_path)
-            # self._operators[operator.alias].blackboard = self._blackboard
+            return BotFactory.summon(bot_name=operator.operator_path)
 
         elif operator.operator_type == OperatorTypes.SYNOD:
             SynodeFactory.load_config(operator.operator_path, alias=operator.alias)
-            self._operators[operator.alias] = SynodeFactory.summon(operator.alias)
+            return SynodeFactory.summon(operator.alias)
 
         elif operator.operator_type == OperatorTypes.BASIC:
             klass = SynodeHelpers.get_class(operator.operator_path)
@@ -685,23 +989,26 @@ class Synode(ABC):
 
                 if self._blackboard and "blackboard" in param_names:
                     Helpers.sysPrint("BASIC BLACKBOARD",type(self._blackboard).__name__)
-                    self._operators[operator.alias] = klass(blackboard=self._blackboard, **_kwargs)
+                    self._board_bound.add(operator.operator_path)
+                    return klass(blackboard=self._blackboard, **_kwargs)
                 else:
-                    self._operators[operator.alias] = klass(**_kwargs)
+                    return klass(**_kwargs)
 
             except Exception as e:
                 Helpers.errPrint(e, "Synode.py", 171)
 
+        return None
+
     async def _run(self, trigger="main", use_input=None, private_board=None, instructions=None, *args, **kwargs):
 
-        trigger_agent = next((item for item in self.synode.synode if item.agent == trigger), None)
+        trigger_agent = self.synode.get_agent(trigger)
 
         if trigger_agent:
             if self._hook:
                 await self._hook(self, action="launch", agent=trigger_agent, data=use_input)
 
             data = await self.run_agent(trigger_agent, use_input=use_input, private_board=private_board)
-            self._loops = {}
+            self._loops.clear()
             return data
         else:
             raise Exception(f"Agent {trigger_agent} does not exist")
@@ -3,23 +3,34 @@ import copy
 import importlib
 import os
 import re
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple, Type
 
 import yaml
 from kimera.helpers.Helpers import Helpers
 
-from .blackboard.types.SynodeTypeLoader import SynodeTypeLoader
+from .blackboard.types.SynodeTypeLoader import FastSynodeTypeLoader
+from .helpers.ConfigCache import ConfigCache
 from .panoptes.Argus import Argus
+from .runtime.ConfigWatcher import ConfigWatcher
 from .panoptes.ArgusFactory import ArgusFactory
 from .schematics.SynodeConfig import SynodeConfig
 from .Synode import Synode, SynodeImpl
+from .SynodePool import SynodePool
 
 
 
 class SynodeFactory:
     _preloaded_configs: Dict[str, Dict[str, Any]] = {}
+    _pools: Dict[str, SynodePool] = {}
+    _validated: Dict[str, Tuple[Type[Synode], SynodeConfig]] = {}
+    _validated_lock = threading.Lock()
+    _sources: Dict[str, str] = {}
+    _versions: Dict[str, int] = {}
+    _watcher: Optional[ConfigWatcher] = None
     _app_path = os.getenv("APP_PATH", "undefined")
     _locked = True
 
@@ -49,9 +60,24 @@ class SynodeFactory:
         else:
             full_path = yaml_path
 
-        with open(full_path, 'r') as file:
-            config = yaml.load(file,Loader=SynodeTypeLoader)
+        return SynodeFactory._register(SynodeFactory._parse_yaml(full_path), full_path, alias=alias)
 
+    @staticmethod
+    def _parse_yaml(full_path: str) -> Dict[str, Any]:
+        """
+        Parses a synod YAML file, served from the on-disk ConfigCache while the file is unchanged.
+        """
+        cache = ConfigCache.default()
+        config = cache.get(full_path) if cache else None
+        if config is None:
+            with open(full_path, 'r') as file:
+                config = yaml.load(file,Loader=FastSynodeTypeLoader)
+            if cache:
+                cache.set(full_path, config)
+        return config
+
+    @staticmethod
+    def _register(config: Dict[str, Any], yaml_path: str, alias: Optional[str] = None) -> Dict[str, Any]:
         name_in_config = config.get("name")
         if not name_in_config:
             raise ValueError(f"Missing 'name' in config file: {yaml_path}")
@@ -62,30 +88,103 @@ class SynodeFactory:
             return SynodeFactory._preloaded_configs[name]
 
         SynodeFactory._preloaded_configs[name] = config
+        SynodeFactory._sources[name] = yaml_path
         return config
 
+    @classmethod
+    def reload(cls, path: str) -> list:
+        """
+        Re-parses one synod file and swaps the configs registered from it. Running instances keep the config
+        they were built with, pooled ones adopt the new version, keeping the operators that did not change.
+        Returns the names that were reloaded.
+        """
+        names = [name for name, source in cls._sources.items() if source == path]
+        if not names:
+            return names
+
+        config = cls._parse_yaml(path)
+        for name in names:
+            with cls._validated_lock:
+                cls._preloaded_configs[name] = config
+                cls._validated.pop(name, None)
+                cls._versions[name] = cls._versions.get(name, 0) + 1
+            Helpers.infoPrint(f"Reloaded config for: {name} (version {cls._versions[name]})")
+
+        for name in names:
+            pool = cls._pools.get(name)
+            if pool:
+                pool.refresh()
+        return names
+
+    @classmethod
+    def watch(cls, interval: float = 1.0) -> ConfigWatcher:
+        """
+        Opt-in hot reload: watches every file loaded so far (and loaded later) and reloads it when it changes.
+        """
+        if cls._watcher is None:
+            cls._watcher = ConfigWatcher(paths=lambda: set(cls._sources.values()), on_change=cls.reload,
+                                         interval=interval)
+        return cls._watcher.start()
+
+    @classmethod
+    def unwatch(cls):
+        if cls._watcher is not None:
+            cls._watcher.stop()
+            cls._watcher = None
+
+    @classmethod
+    def _is_current(cls, synode: Synode) -> bool:
+        return synode.synode.version == cls._versions.get(synode._config_name, 0)
+
+    @classmethod
+    def _refresh(cls, synode: Synode) -> bool:
+        """
+        Brings an idle instance to the current version of its config, False when it has to be replaced.
+        """
+        if cls._is_current(synode):
+            return True
+        _, synode_config = cls._config(synode._config_name)
+        adopted = synode.adopt(synode_config, is_current=lambda operator: not isinstance(operator, Synode)
+                                                                         or cls._is_current(operator))
+        return adopted
+
 
 
     @classmethod
-    def synods_import(cls, folder_path: str):
+    def synods_import(cls, folder_path: str, workers: Optional[int] = None, processes: bool = False):
         """
         Recursively loads all synod YAML configs from a folder and registers them by name.
+        Files are parsed in parallel (threads, or processes with processes=True) and registered in walk order.
         """
+        if cls._locked:
+            raise Exception(f"use SynodeFactory.set_app_path to define the app_path where your application is running!")
+
         full_folder = Path(os.path.join(cls._app_path, folder_path.replace(".", "/")))
         if not full_folder.is_dir():
             raise ValueError(f"Provided path '{folder_path}' is not a valid directory.")
 
+        files = []
         for file in full_folder.rglob("synod.*.yaml"):  # Changed to rglob for recursive search
             match = re.match(r"synod\.(?P<name>\w+)\.yaml", file.name)
             if match:
-                try:
-                    cls.load_config(str(file))
-                    Helpers.infoPrint(f"Loaded config for: {match.group('name')}")
-                except Exception as e:
-                    Helpers.warnPrint(f"Skipping {file.name}: {e}")
+                files.append((file, match.group('name')))
             else:
                 Helpers.warnPrint(f"Skipping {file.name}: filename doesn't match 'synod.[name].yaml' pattern.")
 
+        if not files:
+            return
+
+        executor = ProcessPoolExecutor if processes else ThreadPoolExecutor
+        with executor(max_workers=workers) as pool:
+            parsed = [(file, name, pool.submit(cls._parse_yaml, str(file))) for file, name in files]
+
+        for file, name, future in parsed:
+            try:
+                cls._register(future.result(), str(file))
+                Helpers.infoPrint(f"Loaded config for: {name}")
+            except Exception as e:
+                Helpers.warnPrint(f"Skipping {file.name}: {e}")
+
     @classmethod
     def _invoke(cls,name):
         if name not in cls._preloaded_configs:
@@ -110,12 +209,37 @@ class SynodeFactory:
 
         return klass,raw_config
 
+    @classmethod
+    def _config(cls, name) -> (Type[Synode], SynodeConfig):
+        """
+        Validates a preloaded config once and keeps it frozen, every call gets its own overlay.
+        """
+        with cls._validated_lock:
+            if name not in cls._validated:
+                synode_class, raw_config = cls._invoke(name)
+                synode_config = SynodeConfig.from_config(raw_config, module_class=synode_class)
+                synode_config._version = cls._versions.get(name, 0)
+                cls._validated[name] = (synode_class, synode_config.freeze())
+            synode_class, synode_config = cls._validated[name]
+        return synode_class, synode_config.overlay()
+
+    @classmethod
+    def invalidate(cls, name: Optional[str] = None):
+        """
+        Drops the validated config of name (all of them when None), the next summon validates again.
+        """
+        with cls._validated_lock:
+            if name is None:
+                cls._validated.clear()
+            else:
+                cls._validated.pop(name, None)
+
     @classmethod
     def persist(cls, name: str,persistence_key=None) -> (Synode,str):
 
-        synode_class, raw_config = cls._invoke(name)
-        synode_config = SynodeConfig.from_config(raw_config, module_class=synode_class)
+        synode_class, synode_config = cls._config(name)
         synode = synode_class(synode_config, persistence_key=persistence_key)
+        synode._config_name = name
         if not synode.synode.persistent:
             raise Exception(f"{synode.synode.name} is not persistent. Use summon or set persistent true")
 
@@ -125,10 +249,71 @@ class SynodeFactory:
     @classmethod
     def summon(cls, name: str) -> Synode:
 
-        synode_class, raw_config = cls._invoke(name)
-        synode_config = SynodeConfig.from_config(raw_config, module_class=synode_class)
-        return synode_class(synode_config,persistence_key=None)
+        started = time.perf_counter()
+        synode_class, synode_config = cls._config(name)
+        config_time = time.perf_counter() - started
+
+        synode = synode_class(synode_config,persistence_key=None)
+        synode._startup["config"] = config_time
+        synode._config_name = name
+        return synode
+
 
+    @classmethod
+    def configure_pool(cls, name: str, min_size: int = 1, max_size: int = 8, warm: bool = True) -> SynodePool:
+        """
+        Declares the pool of a preloaded synod, warm=True summons min_size instances right away.
+        Reconfiguring a pool drains its idle instances.
+        """
+        if name not in cls._preloaded_configs:
+            raise KeyError(f"No preloaded config found for name '{name}'.")
+
+        previous = cls._pools.get(name)
+        if previous:
+            previous.drain()
+
+        pool = SynodePool(name, build=lambda: cls.summon(name), min_size=min_size, max_size=max_size,
+                          refresh=cls._refresh)
+        cls._pools[name] = pool
+        if warm:
+            pool.warm_up()
+        return pool
+
+    @classmethod
+    def warm_up(cls, pools: Optional[Dict[str, Dict[str, int]]] = None):
+        """
+        Boot time warm up, pools maps a synod name to its {min_size, max_size}.
+        Without arguments every configured pool is filled up to its min_size.
+        """
+        for name, sizes in (pools or {}).items():
+            cls.configure_pool(name, warm=False, **sizes)
+
+        for name, pool in cls._pools.items():
+            started = time.perf_counter()
+            pool.warm_up()
+            Helpers.infoPrint(f"Warmed {name}: {pool.stats()['idle']} in {time.perf_counter() - started:.3f}s")
+
+    @classmethod
+    def acquire(cls, name: str) -> Synode:
+        """
+        Pooled alternative to summon, hand the instance back with release once its launch is done.
+        Names without a configured pool get a cold one (min_size 0).
+        """
+        pool = cls._pools.get(name)
+        if pool is None:
+            pool = cls.configure_pool(name, min_size=0, warm=False)
+        return pool.acquire()
+
+    @classmethod
+    def release(cls, synode: Synode):
+        pool = cls._pools.get(synode._pool_name) if synode._pool_name else None
+        if pool is None:
+            raise Exception(f"{synode.synode.name} was not acquired from a pool")
+        pool.release(synode)
+
+    @classmethod
+    def pool_stats(cls) -> Dict[str, dict]:
+        return {name: pool.stats() for name, pool in cls._pools.items()}
 
     @classmethod
     def summon_argus(cls, synode_obj: Synode, argus_path) -> Argus:
@@ -154,7 +339,8 @@ class SynodeFactory:
         argus_instance = argus_class(
             name=schema.name,
             blackboard=blackboard_instance,
-            heartbeat=float(schema.heartbeat)
+            heartbeat=float(schema.heartbeat),
+            settle=float(schema.settle or 0)
         )
 
         # Register stalkers
@@ -189,11 +375,7 @@ class SynodeFactory:
 
             def make_hook(agent_name):
 
-                time.sleep(5)
                 async def handler(**kwargs):
-
-
-
                     await synode_obj.launch(trigger=agent_name, use_input=kwargs)
 
                 return handler
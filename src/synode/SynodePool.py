@@ -0,0 +1,117 @@
+import threading
+from collections import deque
+from typing import Callable, Deque, Optional
+
+from kimera.helpers.Helpers import Helpers
+
+from .Synode import Synode
+
+
+class SynodePool:
+    """
+    Idle instances of one preloaded synod, handed out by SynodeFactory.acquire / release.
+    min_size instances are kept warm, at most max_size idle instances are kept, extra releases are dismissed.
+    acquire never blocks: when the pool is empty a new instance is summoned.
+    """
+
+    def __init__(self, name: str, build: Callable[[], Synode], min_size: int = 0, max_size: int = 8,
+                 refresh: Optional[Callable[[Synode], bool]] = None):
+        """
+        :param refresh: called on released and idle instances after a reload, False means the instance is stale
+        """
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise Exception(f"invalid pool size for {name}: min_size={min_size} max_size={max_size}")
+
+        self.name = name
+        self.min_size = min_size
+        self.max_size = max_size
+        self._build = build
+        self._refresh = refresh
+        self._idle: Deque[Synode] = deque()
+        self._lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+        self.dismissed = 0
+
+    def _summon(self) -> Synode:
+        synode = self._build()
+        synode._pool_name = self.name
+        self.created += 1
+        return synode
+
+    def warm_up(self):
+        """
+        Fills the pool up to min_size.
+        """
+        while True:
+            with self._lock:
+                if len(self._idle) >= self.min_size:
+                    return
+            synode = self._summon()
+            with self._lock:
+                self._idle.append(synode)
+
+    def acquire(self) -> Synode:
+        with self._lock:
+            if self._idle:
+                self.reused += 1
+                return self._idle.pop()
+        return self._summon()
+
+    def release(self, synode: Synode):
+        if synode._active_launches:
+            raise Exception(f"{self.name} cannot be released while {synode._active_launches} launches are running")
+
+        synode.reset()
+        if self._refresh and not self._refresh(synode):
+            self._dismiss(synode)
+            return
+
+        with self._lock:
+            if len(self._idle) < self.max_size:
+                self._idle.append(synode)
+                return
+        self._dismiss(synode)
+
+    def _dismiss(self, synode: Synode):
+        with self._lock:
+            self.dismissed += 1
+        if synode.blackboard and not synode.persist:
+            synode.dismiss()
+
+    def refresh(self):
+        """
+        Re-checks the idle instances after a reload: stale ones adopt the new config or are dismissed.
+        """
+        if not self._refresh:
+            return
+        with self._lock:
+            idle, self._idle = list(self._idle), deque()
+        kept = [synode for synode in idle if self._refresh(synode)]
+        for synode in idle:
+            if synode not in kept:
+                self._dismiss(synode)
+        with self._lock:
+            self._idle.extend(kept)
+        self.warm_up()
+
+    def drain(self):
+        """
+        Dismisses every idle instance.
+        """
+        with self._lock:
+            idle, self._idle = list(self._idle), deque()
+        for synode in idle:
+            if synode.blackboard and not synode.persist:
+                synode.dismiss()
+        Helpers.sysPrint("POOL DRAINED", f"{self.name}::{len(idle)}")
+
+    def stats(self) -> dict:
+        return {
+            "idle": len(self._idle),
+            "min_size": self.min_size,
+            "max_size": self.max_size,
+            "created": self.created,
+            "reused": self.reused,
+            "dismissed": self.dismissed,
+        }
@@ -1,24 +1,46 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping, Optional
 
 from pydantic import BaseModel, Field
 
 
+_MISSING = object()
+
+
 class BlackboardHandler(BaseModel):
+    """
+    What a remote worker needs to re-attach a blackboard: the blackboard module path and either
+    the namespace / connection of a MemStore backed board, the digest of a published snapshot or the inline data.
+    options are constructor kwargs the reconnected board must share with the original one.
+    """
     handler: str
     data: Dict[str,Any] = Field(default_factory=dict)
+    namespace: Optional[str] = None
+    connection_name: Optional[str] = None
+    digest: Optional[str] = None
+    options: Dict[str, Any] = Field(default_factory=dict)
 
 class Blackboard(ABC):
     """
     Abstract shared memory space where agents can store and retrieve information.
     Acts as a passive key-value store. No orchestration or logic is executed.
+    The a* methods are the event loop side of the API, boards doing network IO set blocking
+    and run it off the loop.
     """
+    blocking: bool = False
+    # set() extends !ref list / set / queue values instead of replacing them, required by MAP stream_store
+    appends: bool = False
 
     @abstractmethod
     def get(self, key: str, default_value=None):
         """Retrieve a value by key."""
         pass
 
+    def peek(self, key: str, default_value=None):
+        """Retrieve a value by key as it would appear in dump()."""
+        return self.get(key, default_value)
+
     @abstractmethod
     def set(self, key: str, value):
         """Store a value by key."""
@@ -49,10 +71,61 @@ class Blackboard(ABC):
         """Return the entire contents of the blackboard as a dictionary."""
         pass
 
+    async def aget(self, key: str, default_value=None):
+        return self.get(key, default_value)
+
+    async def aset(self, key: str, value):
+        self.set(key, value)
+
+    async def aget_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        return self.get_many(keys)
+
+    async def aset_many(self, values: Mapping[str, Any]):
+        for key, value in values.items():
+            self.set(key, value)
+
+    async def adump(self) -> dict:
+        return self.dump()
+
+    async def aclear(self, delete=True):
+        self.clear(delete)
+
+    async def ahandle(self) -> BlackboardHandler:
+        return self.handle()
+
+    def flush(self):
+        """Push buffered writes to the backing store, boards writing through have nothing to do."""
+        pass
+
+    async def aflush(self):
+        self.flush()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Values of the keys that are set, as get() returns them."""
+        result = {}
+        for key in keys:
+            value = self.get(key, _MISSING)
+            if value is not _MISSING and value is not None:
+                result[key] = value
+        return result
+
+    def snapshot(self) -> Mapping[str, Any]:
+        """Return a read-only view of dump(), implementations may cache it between writes."""
+        return MappingProxyType(self.dump())
+
 
     @classmethod
     def from_dump(cls, data: dict):
        pass
 
+    def handle(self) -> BlackboardHandler:
+        """Compact reference to this blackboard for remote tasks, see attach()."""
+        return BlackboardHandler(handler=type(self).__module__, data=self.dump())
+
+    @classmethod
+    def attach(cls, handle: BlackboardHandler) -> "Blackboard":
+        """Rebuild (or reconnect to) the blackboard described by handle."""
+        return cls.from_dump(handle.data)
+
 
 
@@ -1,24 +1,43 @@
-
-from typing import Any
+import asyncio
+from types import MappingProxyType
+from typing import Any, Iterator, List, Optional, Tuple
 
 from kimera.helpers.Helpers import Helpers
 from kimera.store.StoreFactory import StoreFactory
+from .Blackboard import BlackboardHandler
 from .InMemoryBlackboard import InMemoryBlackboard
+from .WriteBehindBuffer import WriteBehindBuffer
 
 
 class HighFrequencyBlackboard(InMemoryBlackboard):
     """
     High-frequency blackboard that uses Redis hashes for atomic field updates.
     Each 'key' is treated as a logical entity; values are flat key-value fields.
+    Redis calls block, the async API runs them in a worker thread.
+    With write_behind field updates are merged per key and written in batches, see WriteBehindBuffer.
+    Namespace wide operations (clear, dump, iter_dump) walk the keys with a cursor and read / delete
+    batch_size keys per round trip.
     """
+    blocking = True
+    appends = False
+    # bulk client methods found missing, reported once per process
+    _unbatched = set()
 
-    def __init__(self, namespace: str, connection_name=None):
+    def __init__(self, namespace: str, connection_name=None, write_behind: bool = False, flush_size: int = 100,
+                 flush_interval: float = 0.5, batch_size: int = 500):
         super().__init__()
         self.namespace = namespace
+        self.connection_name = connection_name
+        self.batch_size = max(1, int(batch_size))
         self._store = StoreFactory.get_mem_store(
             namespace=f"hf:{namespace}",
             connection_name=connection_name
         )
+        self._buffer: Optional[WriteBehindBuffer] = None
+        if write_behind:
+            # HSET merges fields, so do pending writes to the same key
+            self._buffer = WriteBehindBuffer(self._write_batch, flush_size=flush_size, flush_interval=flush_interval,
+                                             combine=lambda pending, value: {**pending, **value})
 
     def _key(self, key: str) -> str:
         return f"hf:{self.namespace}:{key}"
@@ -34,30 +53,160 @@ class HighFrequencyBlackboard(InMemoryBlackboard):
 
             if not isinstance(value, dict):
                 use_value = {"__value":value if not isinstance(value,bool) else int(value) }
+            if self._buffer is not None:
+                self._buffer.put(key, dict(use_value))
+                return
             self._store.hset(key, mapping=use_value)
         except Exception as e:
             print(e)
             print(value)
             raise e
 
+    def _write_batch(self, values: dict):
+        pipeline = getattr(self._store, "pipeline", None)
+        if pipeline is None:
+            self._warn_unbatched("pipeline")
+            for key, mapping in values.items():
+                self._store.hset(key, mapping=mapping)
+            return
+
+        pipe = pipeline()
+        for key, mapping in values.items():
+            pipe.hset(self._key(key), mapping=mapping)
+        pipe.execute()
+
+    def flush(self):
+        if self._buffer is not None:
+            self._buffer.flush()
+
+    async def aflush(self):
+        if self._buffer is not None and len(self._buffer):
+            await asyncio.to_thread(self._buffer.flush)
+
     def get(self, key: str, default_value=None) -> dict | None:
         """
         Get all fields of the entity stored under `key`.
         """
-        data = self._store.hgetall(key)
+        pending = self._pending(key)
+        # a pending plain value replaces the whole hash, no need to read it
+        data = None if pending and "__value" in pending else self._store.hgetall(key)
+        return self._value(data, pending, default_value)
+
+    def _pending(self, key: str) -> Optional[dict]:
+        if self._buffer is None:
+            return None
+        buffered, pending = self._buffer.get(key)
+        return pending if buffered else None
+
+    @staticmethod
+    def _field(value):
+        """
+        A hash field name or value as HGETALL returns it: Redis keeps strings, bytes replies are decoded.
+        """
+        if isinstance(value, bytes):
+            try:
+                return value.decode("utf-8")
+            except UnicodeDecodeError:
+                return value
+        if isinstance(value, bool):
+            return str(int(value))
+        if isinstance(value, float):
+            return repr(value)
+        return str(value)
+
+    def _value(self, data: Optional[dict], pending: Optional[dict], default_value=None):
+        """
+        Logical value of a hash read from the store with the pending buffered fields laid over it.
+        Both go through _field, a value reads the same before and after its flush.
+        """
+        if pending:
+            data = {**(data or {}), **pending}
 
         if data:
-            for key,value in data.items():
-                if key == "__value":
-                    return value
+            data = {self._field(field): self._field(value) for field, value in data.items()}
+            if "__value" in data:
+                return data["__value"]
             return data
 
         return default_value
 
+    @classmethod
+    def _warn_unbatched(cls, method: str):
+        if method not in cls._unbatched:
+            cls._unbatched.add(method)
+            Helpers.warnPrint(f"[{cls.__name__}] MemStore has no {method}, namespace operations fall back to "
+                              f"one call per key")
+
+    def _iter_keys(self) -> Iterator[str]:
+        """
+        Logical keys of the namespace, SCAN based when the store has scan_iter.
+        scan_iter and pipeline are raw client calls, they get full keys (see _key), not the MemStore relative ones.
+        """
+        scan_iter = getattr(self._store, "scan_iter", None)
+        if scan_iter is not None:
+            raw_keys = scan_iter(match=self._key("*"), count=self.batch_size)
+        else:
+            self._warn_unbatched("scan_iter")
+            raw_keys = self._store.keys(f"*")
+        for raw_key in raw_keys:
+            key = raw_key.decode() if isinstance(raw_key, bytes) else raw_key
+            yield key.split(":")[-1]
+
+    def _iter_batches(self, keys=None) -> Iterator[List[str]]:
+        batch = []
+        for key in (self._iter_keys() if keys is None else keys):
+            batch.append(key)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _hgetall_many(self, keys: List[str]) -> list:
+        pipeline = getattr(self._store, "pipeline", None)
+        if pipeline is None:
+            self._warn_unbatched("pipeline")
+            return [self._store.hgetall(key) for key in keys]
+
+        pipe = pipeline()
+        for key in keys:
+            pipe.hgetall(self._key(key))
+        return pipe.execute()
+
+    def _delete_many(self, keys: List[str]):
+        pipeline = getattr(self._store, "pipeline", None)
+        if pipeline is None:
+            self._warn_unbatched("pipeline")
+            for key in keys:
+                self._store.delete(key)
+            return
+
+        pipe = pipeline()
+        for key in keys:
+            pipe.delete(self._key(key))
+        pipe.execute()
+
+    def get_many(self, keys) -> dict:
+        """
+        Values of the keys that are set, batch_size HGETALLs per round trip.
+        """
+        result = {}
+        for batch in self._iter_batches(list(keys)):
+            for key, data in zip(batch, self._hgetall_many(batch)):
+                value = self._value(data, self._pending(key))
+                if value is not None:
+                    result[key] = value
+        return result
+
+    def peek(self, key: str, default_value=None):
+        return self.get(key, default_value)
+
     def remove(self, key: str):
         """
         Remove all fields (entire hash) for the key.
         """
+        if self._buffer is not None:
+            self._buffer.discard(key)
         self._store.delete(key)
 
     def clear(self,delete=False):
@@ -65,27 +214,73 @@ class HighFrequencyBlackboard(InMemoryBlackboard):
         Flush all tracked entities under this namespace.
         """
         Helpers.sysPrint("NAMESPACE TO DELETE",self.namespace)
-        keys = self._store.keys(f"*")
-        for raw_key in keys:
-            key = raw_key.decode() if isinstance(raw_key, bytes) else raw_key
-            logical_key = key.split(":")[-1]
-            self.remove(logical_key)
-            self._types.clear()
+        if self._buffer is not None:
+            self._buffer.discard()
+        for batch in self._iter_batches():
+            self._delete_many(batch)
+        self._types.clear()
         if delete:
             pass
             #self._store.flush()
 
+    def iter_dump(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Stream (key, value) pairs of all tracked entities, batch_size keys are held at a time.
+        Keys written or removed while iterating may or may not show up.
+        """
+        self.flush()
+        for batch in self._iter_batches():
+            for key, data in zip(batch, self._hgetall_many(batch)):
+                yield key, self._value(data, self._pending(key))
+
     def dump(self) -> dict:
         """
         Get a snapshot of all tracked entities and their fields.
         """
-        keys = self._store.keys(f"*")
-        result = {}
-        for raw_key in keys:
-            key = raw_key.decode() if isinstance(raw_key, bytes) else raw_key
-            logical_key = key.split(":")[-1]
-            result[logical_key] = self.get(logical_key)
-        return result
+        return dict(self.iter_dump())
+
+    def snapshot(self):
+        return MappingProxyType(self.dump())
+
+    async def aget(self, key: str, default_value=None):
+        return await asyncio.to_thread(self.get, key, default_value)
+
+    async def aset(self, key: str, value):
+        await asyncio.to_thread(self.set, key, value)
+
+    async def aget_many(self, keys) -> dict:
+        return await asyncio.to_thread(self.get_many, list(keys))
+
+    async def aset_many(self, values) -> None:
+        def write():
+            for key, value in values.items():
+                self.set(key, value)
+        await asyncio.to_thread(write)
+
+    async def adump(self) -> dict:
+        return await asyncio.to_thread(self.dump)
+
+    async def aclear(self, delete=True):
+        await asyncio.to_thread(self.clear, delete)
+
+    async def ahandle(self) -> BlackboardHandler:
+        await self.aflush()
+        return self.handle()
+
+    def handle(self, connection_name=None) -> BlackboardHandler:
+        """
+        Workers reconnect to the same Redis hashes, nothing is copied.
+        Buffered writes are flushed first so they see them.
+        """
+        self.flush()
+        return BlackboardHandler(handler=type(self).__module__, namespace=self.namespace,
+                                 connection_name=self.connection_name)
+
+    @classmethod
+    def attach(cls, handle: BlackboardHandler) -> "HighFrequencyBlackboard":
+        if handle.namespace is None:
+            return cls.from_dump(handle.data)
+        return cls(namespace=handle.namespace, connection_name=handle.connection_name)
 
     @classmethod
     def from_dump(cls, data: dict, namespace="default", connection_name=None):
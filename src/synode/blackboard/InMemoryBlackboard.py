@@ -1,7 +1,15 @@
-from collections import deque
-from typing import Any
+import asyncio
+import hashlib
+import pickle
+import threading
+import time
+from collections import OrderedDict, deque
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 
-from .Blackboard import Blackboard
+from kimera.store.StoreFactory import StoreFactory
+
+from .Blackboard import Blackboard, BlackboardHandler
 from .types.SynodeDict import SynodeDict
 from .types.SynodeList import SynodeList
 from .types.SynodeSet import SynodeSet
@@ -13,18 +21,54 @@ class InMemoryBlackboard(Blackboard):
     """
     Basic dictionary-backed implementation of Blackboard.
     This is not thread-safe — suitable for single-threaded environments or prototyping.
+    Every set/remove/clear bumps a write version; dump() is served from a cached snapshot
+    that only re-materialises the keys written since the last one.
+    Values mutated in place after get() bypass the version, write them back with set().
     """
+    appends = True
+    SNAPSHOT_NAMESPACE = "bb_snapshots"
+    SNAPSHOT_TTL = 3600
+    # digest -> full dump, on the publishing side (already stored) and the attaching side (already fetched)
+    _snapshots: "OrderedDict[str, dict]" = OrderedDict()
+    _snapshots_lock = threading.Lock()
+    _snapshots_max = 16
+    # (connection_name, digest) -> when it was last sent, re-sent once older than SNAPSHOT_REFRESH so the
+    # MemStore copy never expires under a digest this process still hands out
+    _published: "OrderedDict[tuple, float]" = OrderedDict()
+    SNAPSHOT_REFRESH = SNAPSHOT_TTL / 2
 
     def __init__(self):
         self._store = {}
         self._types = {}
+        self._version = 0
+        self._snapshot = None
+        self._dirty = set()
+        self._handle: Optional[tuple] = None
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def _touch(self, key=None):
+        self._version += 1
+        if key is None:
+            self._snapshot = None
+            self._dirty.clear()
+        elif self._snapshot is not None:
+            self._dirty.add(key)
 
     def get(self, key: str,default_value=None):
         return self._store.get(key, default_value)
 
+    def peek(self, key: str, default_value=None):
+        if key not in self._store:
+            return default_value
+        return self._materialize(self._store[key])
+
     def set_default(self, key: str, value: Any):
         self._store[key] = value
         self._types[key] = type(value)
+        self._touch(key)
 
     def set(self, key: str, value: Any):
         if self.has(key):
@@ -61,8 +105,11 @@ class InMemoryBlackboard(Blackboard):
             self._types[key] = type(value)
             self._store[key] = value
 
+        self._touch(key)
+
     def clear(self, delete=True):
         self._store.clear()
+        self._touch()
 
     def has(self, key: str) -> bool:
         return key in self._store
@@ -70,20 +117,45 @@ class InMemoryBlackboard(Blackboard):
     def remove(self, key: str):
         if key in self._store:
             del self._store[key]
+            self._touch(key)
 
     def keys(self) -> list[str]:
         return list(self._store.keys())
 
+    @staticmethod
+    def _materialize(value):
+        if isinstance(value, (set, SynodeSet, deque)):
+            return list(value)  # convert to list
+        elif isinstance(value, tuple):
+            return list(value)  # also convert tuples
+        elif isinstance(value, (SynodeList, SynodeDict)):
+            return type(value)(value)  # set() extends these in place, snapshots get their own copy
+        return value
+
+    def snapshot(self) -> Mapping[str, Any]:
+        """
+        Read-only view of dump() cached until the next write.
+        Earlier snapshots are never modified by set(), refreshes copy the key table and
+        re-materialise only the dirty keys. Objects mutated in place outside set() are shared.
+        """
+        if self._snapshot is None:
+            data = {k: self._materialize(v) for k, v in self._store.items()}
+        elif self._dirty:
+            data = dict(self._snapshot)
+            for key in self._dirty:
+                if key in self._store:
+                    data[key] = self._materialize(self._store[key])
+                else:
+                    data.pop(key, None)
+        else:
+            return self._snapshot
+
+        self._snapshot = MappingProxyType(data)
+        self._dirty.clear()
+        return self._snapshot
+
     def dump(self) -> dict:
-        result = {}
-        for k, v in self._store.items():
-            if isinstance(v, (set, SynodeSet, deque)):
-                result[k] = list(v)  # convert to list
-            elif isinstance(v, tuple):
-                result[k] = list(v)  # also convert tuples
-            else:
-                result[k] = v
-        return result  # Return a shallow copy
+        return dict(self.snapshot())  # Return a shallow copy
 
 
     def full_dump(self):
@@ -93,6 +165,104 @@ class InMemoryBlackboard(Blackboard):
         }
 
 
+    def _portable_dump(self) -> dict:
+        # from_dump looks types up by name in SynodeTypeMap
+        return {
+            "store": self.dump(),
+            "types": {k: t.__name__ for k, t in self._types.items()}
+        }
+
+    @classmethod
+    def _remember_snapshot(cls, digest: str, data: dict):
+        with cls._snapshots_lock:
+            cls._snapshots[digest] = data
+            cls._snapshots.move_to_end(digest)
+            while len(cls._snapshots) > cls._snapshots_max:
+                cls._snapshots.popitem(last=False)
+
+    @classmethod
+    def _published_recently(cls, digest: str, connection_name: Optional[str]) -> bool:
+        with cls._snapshots_lock:
+            published = cls._published.get((connection_name, digest))
+        return published is not None and time.monotonic() - published < cls.SNAPSHOT_REFRESH
+
+    @classmethod
+    def _mark_published(cls, digest: str, connection_name: Optional[str]):
+        with cls._snapshots_lock:
+            cls._published[(connection_name, digest)] = time.monotonic()
+            cls._published.move_to_end((connection_name, digest))
+            while len(cls._published) > cls._snapshots_max:
+                cls._published.popitem(last=False)
+
+    def _cached_handle(self, connection_name: Optional[str] = None) -> Optional[BlackboardHandler]:
+        if self._handle is None or self._handle[0] != self._version:
+            return None
+        handle = self._handle[1]
+        if handle.connection_name != connection_name or not self._published_recently(handle.digest, connection_name):
+            return None
+        return handle
+
+    @staticmethod
+    def _snapshot_store(connection_name: Optional[str] = None):
+        return StoreFactory.get_mem_store(namespace=InMemoryBlackboard.SNAPSHOT_NAMESPACE,
+                                          connection_name=connection_name)
+
+    def handle(self, connection_name: Optional[str] = None) -> BlackboardHandler:
+        """
+        Content addressed snapshot: the dump is published once to the snapshot MemStore under its sha256 and
+        the handle only carries the digest. Unchanged boards reuse the handle of their version, the snapshot is
+        re-sent when it was published more than SNAPSHOT_REFRESH seconds ago.
+        Falls back to inline data when no MemStore is reachable.
+        """
+        handle = self._cached_handle(connection_name)
+        if handle is not None:
+            return handle
+
+        data = self._portable_dump()
+        payload = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        digest = hashlib.sha256(payload).hexdigest()
+        handle = BlackboardHandler(handler=type(self).__module__, digest=digest, connection_name=connection_name)
+
+        if not self._published_recently(digest, connection_name):
+            try:
+                store = self._snapshot_store(connection_name)
+                store.set(digest, payload)
+                if hasattr(store, "expire"):
+                    store.expire(digest, self.SNAPSHOT_TTL)
+            except Exception as e:
+                PrintHelpers.warnPrint(f"[InMemoryBlackboard] snapshot not published, sending it inline: {e}")
+                return BlackboardHandler(handler=type(self).__module__, data=data)
+            self._remember_snapshot(digest, data)
+            self._mark_published(digest, connection_name)
+
+        self._handle = (self._version, handle)
+        return handle
+
+    async def ahandle(self) -> BlackboardHandler:
+        # publishing a new snapshot is MemStore IO, a handle cached for this version is not
+        handle = self._cached_handle()
+        if handle is not None:
+            return handle
+        return await asyncio.to_thread(self.handle)
+
+    @classmethod
+    def attach(cls, handle: BlackboardHandler) -> "InMemoryBlackboard":
+        """
+        New board from a handle, snapshots fetched once are served from the local cache.
+        """
+        if not handle.digest:
+            return cls.from_dump(handle.data)
+
+        with cls._snapshots_lock:
+            data = cls._snapshots.get(handle.digest)
+        if data is None:
+            payload = cls._snapshot_store(handle.connection_name).get(handle.digest)
+            if payload is None:
+                raise Exception(f"blackboard snapshot {handle.digest} is not available")
+            data = pickle.loads(payload)
+            cls._remember_snapshot(handle.digest, data)
+        return cls.from_dump(data)
+
     @classmethod
     def from_dump(cls, data: dict):
         instance = cls()
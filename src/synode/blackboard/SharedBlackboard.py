@@ -1,8 +1,14 @@
+import asyncio
+import time
 import uuid
+from typing import Dict, Iterable, Optional, Tuple
+from types import MappingProxyType
 from kimera.helpers.Helpers import Helpers
 from kimera.store.StoreFactory import StoreFactory
 
+from .Blackboard import BlackboardHandler
 from .InMemoryBlackboard import InMemoryBlackboard
+from .WriteBehindBuffer import WriteBehindBuffer
 
 
 class SharedBlackboard(InMemoryBlackboard):
@@ -10,27 +16,135 @@ class SharedBlackboard(InMemoryBlackboard):
     InMemoryBlackboard extension that syncs automatically with a MemStore.
     MemStore acts like a fast namespace-isolated in-memory Redis.
     Data is serialized using Pickle for full Python object fidelity.
+    MemStore calls block, the async API runs them in a worker thread.
+
+    With read_cache every write also stores a new random generation token in the namespace; locally cached
+    values stamped with the current token are served after a single token lookup, and without any lookup for
+    max_staleness seconds when the key is in stale_keys (every key when stale_keys is None).
+    Own writes are kept unstamped, the next read outside max_staleness fetches them once.
+
+    With write_behind writes are buffered per key and stored in batches, see WriteBehindBuffer.
+    Other processes see them after flush().
     """
+    blocking = True
+    appends = False
+    GENERATION_KEY = "__bb_generation__"
+    # bulk MemStore methods found missing, reported once per process
+    _unbatched = set()
 
-    def __init__(self, namespace, connection_name=None):
+    def __init__(self, namespace, connection_name=None, read_cache: bool = False, max_staleness: float = 0,
+                 stale_keys: Optional[Iterable[str]] = None, write_behind: bool = False, flush_size: int = 100,
+                 flush_interval: float = 0.5):
         super().__init__()
+        self.namespace = namespace
+        self.connection_name = connection_name
         # Note: each instance has a unique namespace extension
         self.cache = StoreFactory.get_mem_store(
             namespace=f"{namespace}",
             connection_name=connection_name
         )
+        self.read_cache = read_cache
+        self.max_staleness = max_staleness
+        self.stale_keys = set(stale_keys) if stale_keys is not None else None
+        self._stamps: Dict[str, Tuple[Optional[str], float]] = {}
+        self._buffer: Optional[WriteBehindBuffer] = None
+        if write_behind:
+            self._buffer = WriteBehindBuffer(self._write_batch, flush_size=flush_size, flush_interval=flush_interval)
+
+    @classmethod
+    def _warn_unbatched(cls, method: str):
+        if method not in cls._unbatched:
+            cls._unbatched.add(method)
+            Helpers.warnPrint(f"[{cls.__name__}] MemStore has no {method}, bulk operations fall back to one call per key")
+
+    def _bump_generation(self) -> str:
+        generation = uuid.uuid4().hex
+        self.cache.set(self.GENERATION_KEY, generation)
+        return generation
+
+    def _generation(self) -> Optional[str]:
+        return self.cache.get(self.GENERATION_KEY)
+
+    def _fresh(self, key: str) -> bool:
+        """
+        True when the local copy of key may be served without a token lookup (within max_staleness).
+        """
+        stamp = self._stamps.get(key)
+        if stamp is None or not self.max_staleness or (self.stale_keys is not None and key not in self.stale_keys):
+            return False
+        return time.monotonic() - stamp[1] <= self.max_staleness
+
+    def _current(self, key: str, generation: Optional[str]) -> bool:
+        """
+        True when the local copy of key was read under generation, the token currently in the namespace.
+        """
+        stamp = self._stamps.get(key)
+        return stamp is not None and generation is not None and stamp[0] == generation
+
+    def _remember(self, key: str, value, generation: Optional[str]):
+        self._store[key] = value
+        self._stamps[key] = (generation, time.monotonic())
 
     def set(self, key: str, value):
         """
-        Set a value in both local store and MemStore.
+        Set a value in MemStore, with read_cache the local copy is updated right away.
         """
+        if self._buffer is not None:
+            self._buffer.put(key, value)
+            return
 
         self.cache.set(key, value)  # MemStore handles pickle + base64
+        if self.read_cache:
+            self._bump_generation()
+            # another process may have written key before the bump, so the own copy is not stamped with it
+            self._remember(key, value, None)
+
+    def _write_batch(self, values: dict):
+        mset = getattr(self.cache, "mset", None)
+        if mset is not None:
+            mset(values)
+        else:
+            for key, value in values.items():
+                self.cache.set(key, value)
+
+        if self.read_cache:
+            self._bump_generation()
+            for key, value in values.items():
+                self._remember(key, value, None)
+
+    def flush(self):
+        if self._buffer is not None:
+            self._buffer.flush()
+
+    async def aflush(self):
+        if self._buffer is not None and len(self._buffer):
+            await asyncio.to_thread(self._buffer.flush)
 
     def get(self, key: str, default_value=None):
         """
-        Get a value from local store or fallback to MemStore.
+        Get a value from MemStore, with read_cache the local copy is served while the namespace is unchanged.
         """
+        if self._buffer is not None:
+            buffered, value = self._buffer.get(key)
+            if buffered:
+                return value
+
+        if self.read_cache:
+            if self._fresh(key):
+                return self._store[key]
+            mget = getattr(self.cache, "mget", None)
+            if key in self._stamps or mget is None:
+                # the token is read before the value, a write landing in between leaves the entry stale, never wrong
+                generation = self._generation()
+                if self._current(key, generation):
+                    return self._store[key]
+                cached = self.cache.get(key)
+            else:
+                generation, cached = mget([self.GENERATION_KEY, key])
+            if cached is not None:
+                self._remember(key, cached, generation)
+                return cached
+            return default_value
 
         cached = self.cache.get(key)
         if cached is not None:
@@ -39,51 +153,168 @@ class SharedBlackboard(InMemoryBlackboard):
 
         return default_value
 
+    def peek(self, key: str, default_value=None):
+        """
+        Single key counterpart of dump(): MemStore first, then whatever was cached locally.
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        return self._store.get(key, default_value)
+
     def remove(self, key: str):
         """
         Remove a key from both local memory and MemStore.
         """
+        if self._buffer is not None:
+            self._buffer.discard(key)
         super().remove(key)
         self.cache.delete(key)
+        if self.read_cache:
+            self._stamps.pop(key, None)
+            self._bump_generation()
 
     def clear(self,delete=True):
         """
         Flush both local memory and MemStore namespace.
         """
+        if self._buffer is not None:
+            self._buffer.discard()
         self.cache.flush()
+        if self.read_cache:
+            self._stamps.clear()
+            self._bump_generation()
         if delete:
             self._store.clear()
             self._types.clear()
 
-    def dump(self) -> dict:
+    def get_many(self, keys) -> dict:
         """
-        Dump local + shared keys, avoiding double-decoding.
+        Values of the keys present in MemStore, read in one MGET round trip when the store supports it.
         """
-        result = dict(self._store)
+        keys = list(keys)
+        if not keys:
+            return {}
+
+        result = {}
+        if self._buffer is not None:
+            for key in keys:
+                buffered, value = self._buffer.get(key)
+                if buffered and value is not None:
+                    result[key] = value
+            keys = [key for key in keys if key not in result]
+            if not keys:
+                return result
 
+        generation = None
+        if self.read_cache:
+            fresh = [key for key in keys if self._fresh(key)]
+            result.update({key: self._store[key] for key in fresh})
+            keys = [key for key in keys if key not in result]
+            if keys:
+                generation = self._generation()
+                hits = [key for key in keys if self._current(key, generation)]
+                result.update({key: self._store[key] for key in hits})
+                keys = [key for key in keys if key not in result]
+            if not keys:
+                return result
+
+        mget = getattr(self.cache, "mget", None)
+        if mget is not None:
+            values = mget(keys)
+        else:
+            self._warn_unbatched("mget")
+            values = [self.cache.get(key) for key in keys]
+
+        for key, value in zip(keys, values):
+            if value is not None:
+                if self.read_cache:
+                    self._remember(key, value, generation)
+                else:
+                    self._store[key] = value  # cache locally
+                result[key] = value
+        return result
+
+    def _shared_keys(self, prefix: str = None) -> list:
         try:
-            keys = self.cache.keys()
+            keys = self.cache.keys(f"{prefix}*") if prefix else self.cache.keys()
         except Exception:
             keys = []
 
-
+        simple_keys = []
         for key in keys:
             if isinstance(key, bytes):
                 key = key.decode("utf-8")
-
             simple_key = key.split(":")[-1]  # remove namespace
+            if simple_key != self.GENERATION_KEY:
+                simple_keys.append(simple_key)
+        return simple_keys
 
+    def dump(self, keys=None, prefix: str = None) -> dict:
+        """
+        Dump local + shared keys, values are fetched in bulk with get_many.
+        keys and / or prefix restrict the dump to those shared keys, locally cached ones are then left out.
+        """
+        self.flush()
+        if keys is None and prefix is None:
+            result = dict(self._store)
+            use_keys = self._shared_keys()
+        else:
+            result = {}
+            use_keys = list(keys) if keys is not None else self._shared_keys(prefix)
+            if keys is not None and prefix:
+                use_keys = [key for key in use_keys if key.startswith(prefix)]
 
-
-            try:
-                value = self.get(simple_key)
-                if value is not None:
-                    result[simple_key] = value
-            except Exception as e:
-                raise ValueError(f"[SharedBlackboard] Failed to decode key '{simple_key}': {e}")
+        try:
+            result.update(self.get_many(use_keys))
+        except Exception as e:
+            raise ValueError(f"[SharedBlackboard] Failed to decode keys {use_keys}: {e}")
 
         return result
 
+    def snapshot(self):
+        return MappingProxyType(self.dump())
+
+    async def aget(self, key: str, default_value=None):
+        return await asyncio.to_thread(self.get, key, default_value)
+
+    async def aset(self, key: str, value):
+        await asyncio.to_thread(self.set, key, value)
+
+    async def aget_many(self, keys) -> dict:
+        return await asyncio.to_thread(self.get_many, list(keys))
+
+    async def aset_many(self, values) -> None:
+        def write():
+            for key, value in values.items():
+                self.set(key, value)
+        await asyncio.to_thread(write)
+
+    async def adump(self) -> dict:
+        return await asyncio.to_thread(self.dump)
+
+    async def aclear(self, delete=True):
+        await asyncio.to_thread(self.clear, delete)
+
+    async def ahandle(self) -> BlackboardHandler:
+        await self.aflush()
+        return self.handle()
+
+    def handle(self, connection_name=None) -> BlackboardHandler:
+        """
+        Workers reconnect to the same MemStore namespace, nothing is copied.
+        Buffered writes are flushed first so they see them, read_cache travels so their writes bump the token.
+        """
+        self.flush()
+        return BlackboardHandler(handler=type(self).__module__, namespace=self.namespace,
+                                 connection_name=self.connection_name, options={"read_cache": self.read_cache})
+
+    @classmethod
+    def attach(cls, handle: BlackboardHandler) -> "SharedBlackboard":
+        if handle.namespace is None:
+            return cls.from_dump(handle.data)
+        return cls(namespace=handle.namespace, connection_name=handle.connection_name, **handle.options)
+
     @classmethod
     def from_dump(cls, data: dict):
         """
@@ -0,0 +1,110 @@
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from kimera.helpers.Helpers import Helpers
+
+_MISS = (False, None)
+
+
+class WriteBehindBuffer:
+    """
+    Coalesces blackboard writes per key and hands them to write(items) in one batch once flush_size keys
+    are pending or flush_interval seconds after the first pending write.
+    Pending and in-flight values are served by get(), so the owning process always reads its own writes.
+    """
+
+    def __init__(self, write: Callable[[Dict[str, Any]], None], flush_size: int = 100,
+                 flush_interval: Optional[float] = 0.5, combine: Optional[Callable[[Any, Any], Any]] = None):
+        """
+        :param combine: folds a new value into the pending one for stores that merge writes, default keeps the last
+        """
+        self._write = write
+        self._combine = combine
+        self.flush_size = max(1, int(flush_size))
+        self.flush_interval = flush_interval
+        self._pending: Dict[str, Any] = {}
+        self._flushing: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        # one batch at a time, so an older batch never lands after a newer one
+        self._flush_lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self.writes = 0
+        self.batches = 0
+        self.flushed = 0
+
+    def put(self, key: str, value: Any):
+        with self._lock:
+            if self._combine is not None and key in self._pending:
+                value = self._combine(self._pending[key], value)
+            self._pending[key] = value
+            self.writes += 1
+            full = len(self._pending) >= self.flush_size
+            if not full:
+                self._arm()
+        if full:
+            self.flush()
+
+    def _arm(self):
+        # called with _lock held
+        if self._timer is None and self.flush_interval:
+            self._timer = threading.Timer(self.flush_interval, self._flush_later)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        with self._lock:
+            if key in self._pending:
+                return True, self._pending[key]
+            if key in self._flushing:
+                return True, self._flushing[key]
+        return _MISS
+
+    def discard(self, key: Optional[str] = None):
+        """
+        Drop pending writes for key (all of them when key is None), used before removes and clears.
+        """
+        with self._flush_lock, self._lock:
+            if key is None:
+                self._pending.clear()
+            else:
+                self._pending.pop(key, None)
+
+    def _flush_later(self):
+        try:
+            self.flush()
+        except Exception as e:
+            Helpers.warnPrint(f"[WriteBehindBuffer] flush failed, {len(self._pending)} writes kept: {e}")
+
+    def flush(self):
+        with self._flush_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                if not self._pending:
+                    return
+                self._flushing, self._pending = self._pending, {}
+            try:
+                self._write(dict(self._flushing))
+                self.batches += 1
+                self.flushed += len(self._flushing)
+            except Exception:
+                # put the batch back under anything written since, a timer retries it
+                with self._lock:
+                    pending = dict(self._flushing)
+                    for key, value in self._pending.items():
+                        if self._combine is not None and key in pending:
+                            value = self._combine(pending[key], value)
+                        pending[key] = value
+                    self._pending = pending
+                    self._arm()
+                raise
+            finally:
+                with self._lock:
+                    self._flushing = {}
+
+    def __len__(self):
+        return len(self._pending)
+
+    def stats(self) -> dict:
+        return {"writes": self.writes, "batches": self.batches, "flushed": self.flushed, "pending": len(self._pending)}
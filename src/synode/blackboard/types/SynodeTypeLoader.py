@@ -46,3 +46,16 @@ class SynodeTypeLoader(yaml.SafeLoader):
 # Register the constructors
 yaml.add_constructor('!val', SynodeTypeLoader.val_constructor, Loader=SynodeTypeLoader)
 yaml.add_constructor('!ref', SynodeTypeLoader.ref_constructor, Loader=SynodeTypeLoader)
+
+"""
+    libyaml backed loader with the same tags, FastSynodeTypeLoader falls back to the pure python one.
+"""
+if getattr(yaml, "__with_libyaml__", False):
+    class CSynodeTypeLoader(yaml.CSafeLoader):
+        pass
+
+    yaml.add_constructor('!val', SynodeTypeLoader.val_constructor, Loader=CSynodeTypeLoader)
+    yaml.add_constructor('!ref', SynodeTypeLoader.ref_constructor, Loader=CSynodeTypeLoader)
+    FastSynodeTypeLoader = CSynodeTypeLoader
+else:
+    FastSynodeTypeLoader = SynodeTypeLoader
@@ -0,0 +1,179 @@
+from functools import lru_cache
+from typing import Any, FrozenSet, Optional, Tuple, Union
+
+import jmespath
+
+
+@lru_cache(maxsize=4096)
+def _compile_path(path: str):
+    return jmespath.compile(path)
+
+
+# node types whose first child is evaluated against the current node and the others against its result
+_CHAINED = {"subexpression", "index_expression", "projection", "value_projection", "filter_projection",
+            "flatten", "pipe"}
+# node types whose children are all evaluated against the current node
+_PASSTHROUGH = {"multi_select_list", "multi_select_dict", "key_val_pair", "function_expression", "comparator",
+                "or_expression", "and_expression", "not_expression", "literal", "index", "slice"}
+
+
+def _root_keys(node: dict, at_root: bool = True, keys: Optional[set] = None) -> Optional[set]:
+    """
+    Top level keys a parsed jmespath expression reads from its root, None when it needs the whole root
+    (`@`, `*`, or an unknown node).
+    """
+    if keys is None:
+        keys = set()
+    node_type = node.get("type")
+    children = node.get("children", [])
+
+    if node_type == "field":
+        if at_root:
+            keys.add(node["value"])
+        return keys
+    if node_type in ("current", "identity"):
+        return None if at_root else keys
+    if node_type == "expref":
+        return keys
+    if node_type in _CHAINED:
+        for index, child in enumerate(children):
+            if _root_keys(child, at_root and index == 0, keys) is None:
+                return None
+        return keys
+    if node_type in _PASSTHROUGH:
+        for child in children:
+            if isinstance(child, dict) and _root_keys(child, at_root, keys) is None:
+                return None
+        return keys
+    return None if at_root else keys
+
+
+def _find_closing(text: str, start: int) -> int:
+    """
+    Given text[start:start + 2] == "($", returns the index right after the matching ")"
+    or -1 when the group is never closed.
+    """
+    depth = 1
+    i = start + 2
+    while i < len(text) and depth > 0:
+        if text[i:i + 2] == "($":
+            depth += 1
+            i += 2
+        elif text[i] == ")":
+            depth -= 1
+            i += 1
+        else:
+            i += 1
+    return i if depth == 0 else -1
+
+
+def _split(text: str) -> Tuple[Union[str, "CompiledPath"], ...]:
+    """
+    Splits text into literal segments and top level ($...) groups.
+    """
+    parts = []
+    literal_start = 0
+    i = 0
+    while i < len(text):
+        if text[i:i + 2] == "($":
+            end = _find_closing(text, i)
+            if end == -1:
+                break
+            if i > literal_start:
+                parts.append(text[literal_start:i])
+            parts.append(CompiledPath(text[i:end]))
+            literal_start = i = end
+        else:
+            i += 1
+    if literal_start < len(text):
+        parts.append(text[literal_start:])
+    return tuple(parts)
+
+
+class CompiledPath:
+    """
+    A single ($...) group. Paths without nested groups are compiled to jmespath once,
+    nested ones are rendered first and the resulting path is compiled through a bounded cache.
+    """
+    __slots__ = ("source", "parts", "_path", "root_keys")
+
+    def __init__(self, source: str):
+        self.source = source
+        self.parts = _split(source[2:-1])
+        self._path = None
+        self.root_keys: Optional[FrozenSet[str]] = None
+        if all(isinstance(part, str) for part in self.parts):
+            self._path = _compile_path("".join(self.parts))
+            keys = _root_keys(self._path.parsed)
+            self.root_keys = frozenset(keys) if keys is not None else None
+
+    @staticmethod
+    def _search(path, data):
+        val = path.search(data)
+        if val is None:
+            raise KeyError(f"Could not resolve: {path.expression}")
+        return val
+
+    def _render(self, data) -> Tuple[Any, bool]:
+        """
+        Returns (value, True) when the path resolved, or (partially substituted path, False)
+        when a nested group resolved to a dict and cannot be inlined.
+        """
+        if self._path is not None:
+            return self._search(self._path, data), True
+
+        rendered = []
+        for index, part in enumerate(self.parts):
+            if isinstance(part, str):
+                rendered.append(part)
+                continue
+
+            value, resolved = part._render(data)
+            if not resolved:
+                rest = "".join(p if isinstance(p, str) else p.source for p in self.parts[index + 1:])
+                return "".join(rendered) + "($" + value + ")" + rest, False
+            if isinstance(value, dict):
+                rest = "".join(p if isinstance(p, str) else p.source for p in self.parts[index:])
+                return "".join(rendered) + rest, False
+            rendered.append(str(value))
+
+        return self._search(_compile_path("".join(rendered)), data), True
+
+    def value(self, data):
+        return self._render(data)[0]
+
+
+class CompiledTemplate:
+    """
+    Parsed form of an evaluator expression: literal segments plus precompiled ($...) paths.
+    Templates are immutable and shared through a bounded LRU keyed by the expression text.
+    """
+    __slots__ = ("text", "parts", "is_constant", "root_keys")
+
+    def __init__(self, text: str):
+        self.text = text
+        source = f"({text})" if text.startswith("$") else text
+        self.parts = _split(source)
+        self.is_constant = all(isinstance(part, str) for part in self.parts)
+        if self.is_constant:
+            self.text = source
+
+        # keys read from the data root, None when unknown (nested groups, `@`, `*`)
+        self.root_keys: Optional[FrozenSet[str]] = frozenset()
+        for part in self.parts:
+            if isinstance(part, str):
+                continue
+            if part.root_keys is None:
+                self.root_keys = None
+                break
+            self.root_keys = self.root_keys | part.root_keys
+
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def compile(expression: str) -> "CompiledTemplate":
+        return CompiledTemplate(expression)
+
+    def render(self, data) -> str:
+        if self.is_constant:
+            return self.text
+        return "".join(part if isinstance(part, str) else str(part.value(data)) for part in self.parts)
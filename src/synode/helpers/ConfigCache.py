@@ -0,0 +1,66 @@
+import hashlib
+import os
+import pickle
+import tempfile
+from typing import Any, Dict, Optional
+
+from kimera.helpers.Helpers import Helpers as PrintHelpers
+
+from .Helpers import Helpers
+
+
+class ConfigCache:
+    """
+    On-disk cache of parsed synod YAML files, one pickle per source file keyed by its absolute path.
+    An entry is only used while the source keeps the mtime and size it had when it was parsed.
+    Opt-in: SYNODE_CONFIG_CACHE names the folder, which must be private to this user (0700) since entries are
+    unpickled. Unset or "off" disables the cache.
+    """
+    VERSION = 1
+    _default: Optional["ConfigCache"] = None
+    _rejected: Optional[str] = None
+
+    def __init__(self, folder: str):
+        self.folder = Helpers.private_dir(folder)
+
+    @classmethod
+    def default(cls) -> Optional["ConfigCache"]:
+        folder = os.getenv("SYNODE_CONFIG_CACHE")
+        if not folder or folder == "off" or folder == cls._rejected:
+            return None
+        if cls._default is None or cls._default.folder != folder:
+            try:
+                cls._default = cls(folder)
+            except OSError as e:
+                PrintHelpers.warnPrint(f"[ConfigCache] disabled: {e}")
+                cls._rejected = folder
+                return None
+        return cls._default
+
+    def _entry(self, path: str) -> str:
+        digest = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()
+        return os.path.join(self.folder, f"{digest}.pickle")
+
+    @staticmethod
+    def _stamp(path: str) -> tuple:
+        stat = os.stat(path)
+        return ConfigCache.VERSION, stat.st_mtime_ns, stat.st_size
+
+    def get(self, path: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._entry(path), "rb") as file:
+                stamp, config = pickle.load(file)
+        except Exception:
+            return None
+        return config if stamp == self._stamp(path) else None
+
+    def set(self, path: str, config: Dict[str, Any]):
+        entry = self._entry(path)
+        try:
+            # written aside and renamed so concurrent readers never see half an entry
+            fd, tmp = tempfile.mkstemp(dir=self.folder)
+            with os.fdopen(fd, "wb") as file:
+                pickle.dump((self._stamp(path), config), file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, entry)
+        except Exception:
+            pass
@@ -1,4 +1,6 @@
 import importlib
+import os
+import stat
 
 
 class Helpers:
@@ -14,6 +16,20 @@ class Helpers:
         except Exception as e:
             raise e
 
+    @staticmethod
+    def private_dir(path: str) -> str:
+        """
+        Creates path with 0700 and checks an existing one is owned by this user and closed to others.
+        For folders holding pickles: anyone able to write there could make us load code.
+        """
+        os.makedirs(path, mode=0o700, exist_ok=True)
+        info = os.stat(path)
+        if hasattr(os, "getuid") and info.st_uid != os.getuid():
+            raise PermissionError(f"{path} is not owned by the current user")
+        if stat.S_IMODE(info.st_mode) & 0o077:
+            raise PermissionError(f"{path} is accessible to other users, expected mode 0700")
+        return path
+
     @staticmethod
     def get_method(instance, method_name):
         """
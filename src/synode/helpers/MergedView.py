@@ -0,0 +1,74 @@
+from collections.abc import Mapping
+from typing import Any, Optional
+
+_MISSING = object()
+
+
+class MergedView(Mapping):
+    """
+    Read-only view over (input, private board, shared board) used as jmespath root.
+    Keys are looked up on demand in that order and memoized for the lifetime of the view,
+    so an evaluation only touches the keys its expression actually reads.
+    """
+
+    def __init__(self, shared: Any = None, private_board: Optional[Any] = None, input_dict: Optional[dict] = None):
+        self._shared = shared if shared is not None else {}
+        self._private = private_board
+        self._input = input_dict if isinstance(input_dict, dict) else None
+        self._cache = {}
+        self._merged = None
+
+    @staticmethod
+    def _peek(layer, key):
+        if hasattr(layer, "peek"):
+            return layer.peek(key, _MISSING)
+        return layer.get(key, _MISSING)
+
+    def _lookup(self, key):
+        if key in self._cache:
+            return self._cache[key]
+
+        value = _MISSING
+        if key == "__input" and self._input is not None:
+            value = self._input
+        if value is _MISSING and self._private is not None:
+            value = self._peek(self._private, key)
+        if value is _MISSING:
+            value = self._peek(self._shared, key)
+
+        self._cache[key] = value
+        return value
+
+    def _materialize(self) -> dict:
+        """
+        Full merge, only needed when an expression iterates the root (e.g. `*` or `keys(@)`).
+        """
+        if self._merged is None:
+            base = self._shared.dump() if hasattr(self._shared, "dump") else self._shared
+            private_data = self._private.dump() if self._private is not None else {}
+            self._merged = {**base, **private_data}
+            if self._input is not None:
+                self._merged["__input"] = self._input
+        return self._merged
+
+    def get(self, key, default=None):
+        value = self._lookup(key)
+        return default if value is _MISSING else value
+
+    def __getitem__(self, key):
+        value = self._lookup(key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return self._lookup(key) is not _MISSING
+
+    def __iter__(self):
+        return iter(self._materialize())
+
+    def __len__(self):
+        return len(self._materialize())
+
+    def __repr__(self):
+        return repr(self._materialize())
@@ -1,107 +1,57 @@
-import re
 from typing import Optional
 
-import jmespath
-from kimera.helpers.Helpers import Helpers
-
+from .CompiledTemplate import CompiledTemplate, CompiledPath
+from .MergedView import MergedView
 from ..blackboard.InMemoryBlackboard import InMemoryBlackboard
 
 
 class SafeEvaluator:
-    _VAR_PATTERN = re.compile(r"\$([a-zA-Z0-9_.\[\]]+)")  # precompiled regex
-
     def __init__(self, blackboard=None):
         self._blackboard = blackboard
         self._data = blackboard if blackboard else {}
 
     @staticmethod
     def interpolate(expression, merged_data):
-
-
         # Match innermost ($...) group, supports nested resolution
-        pattern = re.compile(r"\(\$([^\(\)]+?)\)")
-
-        def resolve(path: str):
-            val = jmespath.search(path, merged_data)
-            if val is None:
-                raise KeyError(f"Could not resolve: {path}")
-            return val
-
-        def resolve_nested(expr: str):
-            # Resolve all innermost ($...) recursively
-            while True:
-                match = pattern.search(expr)
-                if not match:
-                    break
-                full = match.group(0)  # e.g., "($foo.bar)"
-                inner = match.group(1)  # e.g., "foo.bar"
-                result = resolve(inner)
-                # Only allow non-dict replacements inside other expressions
-                if isinstance(result, dict):
-                    return expr
-                expr = expr[:match.start()] + str(result) + expr[match.end():]
-            return resolve(expr)
-
-        # Start with top-level expression check
         expr = expression.strip()
         if expr.startswith("($") and expr.endswith(")"):
-            return resolve_nested(expr[2:-1])
+            return CompiledPath(expr).value(merged_data)
         else:
             return expr
 
     def eval(self, expression, private_board: Optional[InMemoryBlackboard],input_dict=None):
+        return self.render(CompiledTemplate.compile(expression), private_board=private_board,
+                           input_dict=input_dict)
 
-            if private_board is None:
-                private_data = {}
-            else:
-                private_data = private_board.dump()
-
-            base = self._data.dump() if hasattr(self._data, "dump") else self._data
-            _merged_data = {**base, **private_data}
-
+    def render(self, template: CompiledTemplate, private_board: Optional[InMemoryBlackboard], input_dict=None):
+        if template.is_constant:
+            return template.text
 
+        _merged_data = MergedView(shared=self._data, private_board=private_board, input_dict=input_dict)
 
-            if isinstance(input_dict,dict):
-                _merged_data = {**_merged_data,"__input": input_dict}
+        return template.render(_merged_data)
 
+    async def aeval(self, expression, private_board: Optional[InMemoryBlackboard], input_dict=None):
+        return await self.arender(CompiledTemplate.compile(expression), private_board=private_board,
+                                  input_dict=input_dict)
 
+    async def arender(self, template: CompiledTemplate, private_board: Optional[InMemoryBlackboard],
+                      input_dict=None):
+        """
+        render() for code running on the event loop. With a blocking (MemStore backed) blackboard the root keys
+        the template reads are prefetched in one non blocking call, or the whole board when they are unknown.
+        """
+        if template.is_constant:
+            return template.text
 
-            if expression.startswith("$"):
-                expression = f"({expression})"
+        if not getattr(self._blackboard, "blocking", False):
+            return self.render(template, private_board=private_board, input_dict=input_dict)
 
-            def extract_top_level_expressions(text: str):
-                results = []
-                i = 0
-                while i < len(text):
-                    if text[i:i + 2] == "($":
-                        start = i
-                        depth = 1
-                        i += 2
-                        while i < len(text) and depth > 0:
-                            if text[i:i + 2] == "($":
-                                depth += 1
-                                i += 2
-                            elif text[i] == ")":
-                                depth -= 1
-                                i += 1
-                            else:
-                                i += 1
-                        if depth == 0:
-                            results.append(text[start:i])
-                    else:
-                        i += 1
-                return results
-
-            matches = extract_top_level_expressions(expression)
+        if template.root_keys is None:
+            shared = await self._blackboard.adump()
+        else:
+            shared = await self._blackboard.aget_many([key for key in template.root_keys if key != "__input"])
 
-            result = expression
-            for match in matches:
-                value = SafeEvaluator.interpolate(match, merged_data=_merged_data)
-                #if isinstance(value,str):
-                result = result.replace(match, str(value), 1)
-                # else:
-                #     print(_merged_data)
-                #     Helpers.sysPrint("EVAL VALUE", value)
-                #     return value
+        _merged_data = MergedView(shared=shared, private_board=private_board, input_dict=input_dict)
 
-            return result
+        return template.render(_merged_data)
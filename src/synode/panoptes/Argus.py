@@ -15,10 +15,12 @@ from ..blackboard.Blackboard import Blackboard
 
 
 class Argus:
-    def __init__(self,name,heartbeat: Optional[float] = 1,blackboard: Optional[Blackboard] = None):
+    def __init__(self,name,heartbeat: Optional[float] = 1,blackboard: Optional[Blackboard] = None,
+                 settle: Optional[float] = 0):
         """
         Argus only uses ThreadKraken to manage its own lightweight listener thread.
         Stalkers are started by the Spawner (as full subprocesses).
+        settle is the time given to the stalkers in run() before the hooks start listening.
         """
         self.name = name
         self._kraken = ThreadKraken()
@@ -31,6 +33,7 @@ class Argus:
         self._watch: Dict[str,str] = {}
         self._watched = {}
         self._heartbeat = heartbeat
+        self._settle = settle or 0
         self._is_running = False
 
     @property
@@ -103,7 +106,7 @@ class Argus:
         if not self.blackboard:
             raise ValueError("Blackboard not initialized.")
 
-        data = self.blackboard.dump()
+        data = self.blackboard.snapshot()
 
         try:
             result = jmespath.search(expression.replace("$",""), data)
@@ -156,6 +159,9 @@ class Argus:
                 if self._registered_stalkers.get(stalker).running:
                     await self.start_stalker(stalker)
 
+            if self._settle:
+                await asyncio.sleep(self._settle)
+
             self._kraken.register_thread(name="argus",target=self.overwatch)
             self._kraken.start_thread("argus")
             self._is_running = True
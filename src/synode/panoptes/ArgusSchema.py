@@ -24,6 +24,7 @@ class ArgusSchema(BaseModel):
     module: str
     name: str
     heartbeat: Optional[float] = 1
+    settle: Optional[float] = 0
     blackboard: Optional[BlackboardInit] = None
     stalkers: List[StalkerSchema]
     watch: List[ArgusWatchSchema] = Field(default_factory=list)
@@ -0,0 +1,103 @@
+import os
+import threading
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from kimera.helpers.Helpers import Helpers
+
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:  # optional, falls back to polling
+    INotify = None
+    inotify_flags = None
+
+
+class ConfigWatcher:
+    """
+    Background thread reporting changed files. Files are compared on (mtime, size); with inotify_simple installed
+    the thread wakes up on writes in the watched folders instead of sleeping a full interval.
+    """
+
+    def __init__(self, paths: Callable[[], Iterable[str]], on_change: Callable[[str], None], interval: float = 1.0):
+        """
+        :param paths: the files to watch, re-read on every check so newly loaded configs are picked up
+        :param on_change: called from the watcher thread with the path of every changed file
+        """
+        self._paths = paths
+        self._on_change = on_change
+        self.interval = interval
+        self._stamps: Dict[str, Optional[Tuple[int, int]]] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._inotify = None
+        self._watched_dirs = set()
+
+    @staticmethod
+    def _stamp(path: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "ConfigWatcher":
+        if self.is_running:
+            return self
+        for path in self._paths():
+            self._stamps[path] = self._stamp(path)
+        if INotify is not None:
+            self._inotify = INotify()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="synode-config-watcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.interval * 2)
+        self._thread = None
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+            self._watched_dirs.clear()
+
+    def check(self):
+        """
+        One pass over the watched files, changed ones are reported to on_change.
+        """
+        for path in list(self._paths()):
+            stamp = self._stamp(path)
+            if path not in self._stamps:
+                self._stamps[path] = stamp
+                continue
+            if stamp is None or stamp == self._stamps[path]:
+                continue
+            self._stamps[path] = stamp
+            try:
+                self._on_change(path)
+            except Exception as e:
+                Helpers.warnPrint(f"Reload of {path} failed: {e}")
+
+    def _wait(self):
+        if self._inotify is None:
+            self._stop.wait(self.interval)
+            return
+
+        for folder in {os.path.dirname(path) for path in self._paths()} - self._watched_dirs:
+            try:
+                self._inotify.add_watch(folder, inotify_flags.CLOSE_WRITE | inotify_flags.MOVED_TO
+                                        | inotify_flags.CREATE)
+                self._watched_dirs.add(folder)
+            except OSError:
+                pass
+        self._inotify.read(timeout=int(self.interval * 1000))
+
+    def _loop(self):
+        while not self._stop.is_set():
+            self._wait()
+            if not self._stop.is_set():
+                self.check()
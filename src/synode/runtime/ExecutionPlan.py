@@ -0,0 +1,100 @@
+from typing import Any, Dict, Optional, Tuple
+
+from ..helpers.CompiledTemplate import CompiledTemplate
+from ..schematics.Enums import OperatorTypes, SynodeOpType
+
+
+class OperatorRef:
+    """
+    A resolved "alias::handler" operator string.
+    """
+    __slots__ = ("alias", "handler")
+
+    def __init__(self, use_operator: str):
+        parts = use_operator.split("::")
+        self.alias = parts[0]
+        self.handler = parts[1] if len(parts) > 1 else None
+
+
+class TargetPlan:
+    """
+    An op target, pre-resolved to its agent when the expression is constant.
+    """
+    __slots__ = ("expression", "template", "agent")
+
+    def __init__(self, expression: str, config):
+        self.expression = expression
+        self.template = CompiledTemplate.compile(expression)
+        self.agent = config.get_agent(self.template.text) if self.template.is_constant else None
+
+
+class OpPlan:
+    __slots__ = ("op", "scope_key", "target", "targets", "condition", "stream")
+
+    def __init__(self, agent_name: str, index: int, op, config):
+        self.op = op
+        self.scope_key = f"op:{agent_name}.{index}"
+        self.target: Optional[TargetPlan] = None
+        self.targets: Optional[Tuple[TargetPlan, ...]] = None
+        self.condition: Optional[CompiledTemplate] = None
+        # MAP / FILTER results appended to store_key as they arrive instead of one store at the end
+        self.stream = bool(op.store_key and op.kwargs.get("stream_store", False)
+                           and op.op_type in (SynodeOpType.MAP, SynodeOpType.FILTER) and config.store_appends(op))
+
+        if isinstance(op.target, str):
+            self.target = TargetPlan(op.target, config)
+        else:
+            self.targets = tuple(TargetPlan(target, config) for target in op.target)
+
+        if op.op_type == SynodeOpType.LOOP_TO:
+            self.condition = CompiledTemplate.compile(op.kwargs.get("condition", "`true`"))
+
+
+class AgentPlan:
+    """
+    Everything run_agent needs about an agent that does not depend on runtime data:
+    compiled operator / instructions templates, the pre-split operator when it is constant
+    and the name of the Synode dispatch method for its operator type.
+    """
+    __slots__ = ("agent", "operator", "operator_ref", "instructions", "dispatch", "operations")
+
+    def __init__(self, agent, config):
+        self.agent = agent
+        self.operator = CompiledTemplate.compile(agent.operator.replace("@", "\n"))
+        self.operator_ref: Optional[OperatorRef] = None
+        self.dispatch: Optional[str] = None
+        if self.operator.is_constant:
+            self.operator_ref = OperatorRef(self.operator.text.replace("\n", "@"))
+            operator = config.get_operator(self.operator_ref.alias)
+            if operator is not None:
+                self.dispatch = ExecutionPlan.DISPATCHERS.get(operator.operator_type)
+
+        self.instructions = CompiledTemplate.compile(agent.instructions)
+        self.operations = tuple(OpPlan(agent.agent, index, op, config) for index, op in enumerate(agent.operations))
+
+
+class ExecutionPlan:
+    """
+    Compiled form of a SynodeConfig walked by Synode.run_agent instead of the raw pydantic models.
+    """
+    DISPATCHERS: Dict[OperatorTypes, str] = {
+        OperatorTypes.HYDRA: "_dispatch_hydra",
+        OperatorTypes.SYNOD: "_dispatch_synode",
+        OperatorTypes.ARGUS: "_dispatch_argus",
+        OperatorTypes.BOT: "_dispatch_bot",
+        OperatorTypes.BASIC: "_dispatch_basic",
+    }
+
+    def __init__(self, config):
+        self._config = config
+        self._agents: Dict[str, AgentPlan] = {}
+        for agent in config.synode:
+            if agent.agent not in self._agents:
+                self._agents[agent.agent] = AgentPlan(agent, config)
+
+    def for_agent(self, agent: Any) -> AgentPlan:
+        plan = self._agents.get(agent.agent)
+        if plan is None or plan.agent is not agent:
+            # agents built outside the config are compiled on the fly
+            return AgentPlan(agent, self._config)
+        return plan
@@ -0,0 +1,54 @@
+import asyncio
+import uuid
+from contextvars import ContextVar, Token
+from typing import Any, Dict, List, Optional
+
+_current: ContextVar[Optional["LaunchContext"]] = ContextVar("synode_launch", default=None)
+
+
+class LaunchContext:
+    """
+    State owned by a single launch(): LOOP_TO counters, hook tasks, the private board and the deadline.
+    It travels with the asyncio context, so FORK_TO / MAP tasks see the launch that spawned them
+    and concurrent launches on the same Synode never share it.
+    """
+
+    def __init__(self, owner: Any, private_board=None, timeout: Optional[float] = None):
+        self.id = uuid.uuid4().hex[:8]
+        self.owner = owner
+        self.private_board = private_board
+        self.loops: Dict[str, int] = {}
+        self.tasks: List[asyncio.Task] = []
+        self.deadline: Optional[float] = None
+        if timeout is not None:
+            self.deadline = asyncio.get_running_loop().time() + timeout
+
+    @staticmethod
+    def current() -> Optional["LaunchContext"]:
+        return _current.get()
+
+    def activate(self) -> Token:
+        return _current.set(self)
+
+    @staticmethod
+    def restore(token: Token):
+        _current.reset(token)
+
+    def remaining(self) -> Optional[float]:
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - asyncio.get_running_loop().time())
+
+    async def clear_tasks(self):
+        for task in self.tasks:
+            if not task.done():
+                task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                # Swallow it—expected during shutdown
+                pass
+            except Exception as e:
+                # Log or handle unexpected exceptions
+                print(f"[Cleanup] Unexpected exception: {e}")
+        self.tasks.clear()
@@ -0,0 +1,109 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, Optional
+
+
+class Limiter:
+    """
+    Named concurrency budget. A limit of None only records stats.
+    The underlying semaphore is created per event loop, so a Synode driven by
+    successive asyncio.run calls keeps working.
+    """
+
+    def __init__(self, name: str, limit: Optional[int] = None):
+        self.name = name
+        self.limit = limit
+        self._loop = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.in_flight = 0
+        self.waiting = 0
+        self.acquired = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.limit)
+        return self._semaphore
+
+    async def acquire(self):
+        started = time.perf_counter()
+        if self.limit:
+            self.waiting += 1
+            try:
+                await self._get_semaphore().acquire()
+            finally:
+                self.waiting -= 1
+
+        waited = time.perf_counter() - started
+        self.in_flight += 1
+        self.acquired += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+
+    def release(self):
+        self.in_flight -= 1
+        if self.limit:
+            self._get_semaphore().release()
+
+    def stats(self) -> dict:
+        return {
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "acquired": self.acquired,
+            "total_wait": self.total_wait,
+            "max_wait": self.max_wait,
+            "avg_wait": self.total_wait / self.acquired if self.acquired else 0.0,
+        }
+
+
+class LimiterRegistry:
+    """
+    Concurrency budgets owned by a Synode instance, keyed globally, per agent, per operator alias
+    and per operation scope. Every dispatch in the instance, however deeply nested inside
+    FORK_TO / MAP fan-outs, draws from the same limiters.
+    """
+    GLOBAL = "global"
+
+    def __init__(self, global_limit: Optional[int] = None):
+        self._limiters: Dict[str, Limiter] = {}
+        self.limiter(self.GLOBAL, global_limit)
+
+    def limiter(self, key: str, limit: Optional[int] = None) -> Limiter:
+        """
+        Returns the limiter registered under key, creating it with limit on first use.
+        """
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            limiter = self._limiters[key] = Limiter(name=key, limit=limit)
+        return limiter
+
+    def for_dispatch(self, agent: str, agent_limit: Optional[int], operator: str,
+                     operator_limit: Optional[int] = None, scope: Optional[Limiter] = None) -> list[Limiter]:
+        """
+        Limiters one operator call must hold, narrowest first so waiting callers do not sit on global slots.
+        """
+        limiters = [] if scope is None else [scope]
+        limiters.append(self.limiter(f"agent:{agent}", agent_limit))
+        limiters.append(self.limiter(f"operator:{operator}", operator_limit))
+        limiters.append(self._limiters[self.GLOBAL])
+        return limiters
+
+    @asynccontextmanager
+    async def hold(self, *limiters: Limiter):
+        held = []
+        try:
+            for limiter in limiters:
+                await limiter.acquire()
+                held.append(limiter)
+            yield
+        finally:
+            for limiter in reversed(held):
+                limiter.release()
+
+    def stats(self) -> Dict[str, dict]:
+        return {key: limiter.stats() for key, limiter in self._limiters.items()}
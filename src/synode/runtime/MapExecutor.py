@@ -0,0 +1,65 @@
+import asyncio
+import inspect
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+_DROPPED = object()
+
+
+class MapExecutor:
+    """
+    Fan-out engine behind MAP / FILTER.
+    Items are pulled lazily from the input so at most `max_in_flight` tasks exist at once,
+    results are handed to `on_result` as they complete and returned in input order.
+    """
+
+    def __init__(self, max_in_flight: int = 30):
+        self.max_in_flight = max(1, int(max_in_flight))
+
+    async def run(self,
+                  items: Iterable[Any],
+                  worker: Callable[[Any], Awaitable[Any]],
+                  keep: Optional[Callable[[Any], bool]] = None,
+                  on_result: Optional[Callable[[int, Any], Any]] = None) -> list:
+        """
+        :param items: input items, consumed lazily
+        :param worker: coroutine function applied to every item
+        :param keep: FILTER predicate, rejected results are dropped as soon as they arrive
+        :param on_result: called with (index, value) for every kept result in completion order, may be async
+        """
+        results = []
+        pending = {}
+        source = iter(items)
+        exhausted = False
+
+        try:
+            while True:
+                while not exhausted and len(pending) < self.max_in_flight:
+                    try:
+                        item = next(source)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    pending[asyncio.ensure_future(worker(item))] = len(results)
+                    results.append(_DROPPED)
+
+                if not pending:
+                    break
+
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=pending.get):
+                    index = pending.pop(task)
+                    value = task.result()
+                    if keep is not None and not keep(value):
+                        continue
+                    results[index] = value
+                    if on_result is not None:
+                        handled = on_result(index, value)
+                        if inspect.isawaitable(handled):
+                            await handled
+        except BaseException:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            raise
+
+        return [value for value in results if value is not _DROPPED]
@@ -0,0 +1,226 @@
+import asyncio
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from kimera.store.StoreFactory import StoreFactory
+
+from ..helpers.Helpers import Helpers
+from ..schematics.Enums import MemoBackends, MemoScopes
+
+_MISS = (False, None)
+
+
+class MemoBackend(ABC):
+    """
+    Storage for memoized agent results. Entries carry their own expiry timestamp (None = no expiry).
+    Backends doing IO set blocking, MemoCache.aget / aset then run them off the event loop.
+    """
+    blocking: bool = False
+
+    @abstractmethod
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Return (hit, value)."""
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: Any, expires: Optional[float] = None):
+        pass
+
+    @abstractmethod
+    def clear(self):
+        pass
+
+    def __len__(self):
+        return 0
+
+
+class DictMemoBackend(MemoBackend):
+    """
+    In-process LRU.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, Tuple[Optional[float], Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return _MISS
+            expires, value = entry
+            if expires is not None and expires < time.time():
+                del self._entries[key]
+                return _MISS
+            self._entries.move_to_end(key)
+            return True, value
+
+    def set(self, key: str, value: Any, expires: Optional[float] = None):
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class MemStoreMemoBackend(MemoBackend):
+    """
+    Shared MemStore namespace, visible to every process using the same connection.
+    Expiry is checked on read; max_entries cannot be enforced here, rely on ttl.
+    """
+    blocking = True
+
+    def __init__(self, namespace: str = "synode_memo", connection_name: Optional[str] = None):
+        self._store = StoreFactory.get_mem_store(namespace=f"memo:{namespace}", connection_name=connection_name)
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        entry = self._store.get(key)
+        if entry is None:
+            return _MISS
+        expires, value = entry
+        if expires is not None and expires < time.time():
+            self._store.delete(key)
+            return _MISS
+        return True, value
+
+    def set(self, key: str, value: Any, expires: Optional[float] = None):
+        self._store.set(key, (expires, value))
+
+    def clear(self):
+        self._store.flush()
+
+
+class SqliteMemoBackend(MemoBackend):
+    """
+    Local sqlite file, survives restarts. LRU is tracked with a last-access timestamp.
+    Values are pickles, the default file lives in a private ~/.cache/synode folder; an explicit path
+    must not be writable by other users.
+    """
+    blocking = True
+    DEFAULT_FOLDER = os.path.join(os.path.expanduser("~"), ".cache", "synode")
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = 1024):
+        self.path = path or os.path.join(Helpers.private_dir(self.DEFAULT_FOLDER), "synode_memo.sqlite")
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS memo "
+                           "(key TEXT PRIMARY KEY, value BLOB, expires REAL, touched REAL)")
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        with self._lock:
+            row = self._conn.execute("SELECT value, expires FROM memo WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return _MISS
+            value, expires = row
+            if expires is not None and expires < time.time():
+                self._conn.execute("DELETE FROM memo WHERE key = ?", (key,))
+                return _MISS
+            self._conn.execute("UPDATE memo SET touched = ? WHERE key = ?", (time.time(), key))
+            return True, pickle.loads(value)
+
+    def set(self, key: str, value: Any, expires: Optional[float] = None):
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO memo (key, value, expires, touched) VALUES (?, ?, ?, ?)",
+                               (key, pickle.dumps(value), expires, time.time()))
+            self._conn.execute("DELETE FROM memo WHERE key NOT IN "
+                               "(SELECT key FROM memo ORDER BY touched DESC LIMIT ?)", (self.max_entries,))
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM memo")
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM memo").fetchone()[0]
+
+
+class MemoCache:
+    """
+    Memoizes agent dispatches keyed on (operator definition, handler, evaluated instructions, input).
+    """
+    _shared: Dict[tuple, "MemoCache"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, backend: MemoBackend, ttl: Optional[float] = None):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(operator: Any, handler: Optional[str], instructions: Optional[str], use_input: Any,
+                 extra: Optional[dict] = None) -> str:
+        """
+        :param operator: what the operator is, not its alias, aliases are only unique within one synod
+        :param extra: dispatch kwargs that reach the operator next to use_input
+        """
+        parts = [operator, handler, instructions, use_input]
+        if extra:
+            parts.append(extra)
+        payload = json.dumps(parts, sort_keys=True, default=repr)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        hit, value = self.backend.get(key)
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return hit, value
+
+    def set(self, key: str, value: Any):
+        expires = time.time() + self.ttl if self.ttl else None
+        self.backend.set(key, value, expires=expires)
+
+    async def aget(self, key: str) -> Tuple[bool, Any]:
+        if self.backend.blocking:
+            return await asyncio.to_thread(self.get, key)
+        return self.get(key)
+
+    async def aset(self, key: str, value: Any):
+        if self.backend.blocking:
+            await asyncio.to_thread(self.set, key, value)
+        else:
+            self.set(key, value)
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.backend)}
+
+    @classmethod
+    def from_config(cls, config) -> "MemoCache":
+        """
+        Builds the cache for an AgentCache config. Process scoped caches are shared by every
+        Synode in the process that declares the same backend settings.
+        """
+        if config.backend == MemoBackends.MEMSTORE:
+            build = lambda: MemStoreMemoBackend(namespace=config.namespace, connection_name=config.connection_name)
+        elif config.backend == MemoBackends.SQLITE:
+            build = lambda: SqliteMemoBackend(path=config.path, max_entries=config.max_entries)
+        else:
+            build = lambda: DictMemoBackend(max_entries=config.max_entries)
+
+        if config.scope != MemoScopes.PROCESS:
+            return cls(backend=build(), ttl=config.ttl)
+
+        key = (config.backend, config.namespace, config.connection_name, config.path, config.max_entries, config.ttl)
+        with cls._shared_lock:
+            if key not in cls._shared:
+                cls._shared[key] = cls(backend=build(), ttl=config.ttl)
+            return cls._shared[key]
@@ -0,0 +1,75 @@
+import asyncio
+import weakref
+from typing import Any, Awaitable, Callable, List, Optional, Set, Tuple
+
+
+class MicroBatcher:
+    """
+    Groups concurrent submit() calls into one send(items) call: a batch leaves when it holds batch_size items
+    or linger seconds after its first item, whichever comes first. send must return one result per item,
+    in order. Bound to the event loop it was created on.
+    """
+
+    def __init__(self, send: Callable[[list], Awaitable[list]], batch_size: int, linger: float = 0.05):
+        self._send = send
+        self.batch_size = max(1, int(batch_size))
+        self.linger = linger
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._sending: Set[asyncio.Task] = set()
+        self._loop: Optional[weakref.ref] = None
+        self.batches = 0
+        self.items = 0
+
+    def bound_to(self, loop: asyncio.AbstractEventLoop) -> bool:
+        """
+        False once the batcher was used on another loop, it can not serve this one.
+        """
+        return self._loop is None or self._loop() is loop
+
+    async def submit(self, item: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        if self._loop is None:
+            self._loop = weakref.ref(loop)
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.linger, self.flush)
+
+        return await future
+
+    def flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = asyncio.ensure_future(self._send_batch(batch))
+        self._sending.add(task)
+        task.add_done_callback(self._sending.discard)
+
+    async def _send_batch(self, batch: List[Tuple[Any, asyncio.Future]]):
+        self.batches += 1
+        self.items += len(batch)
+        try:
+            results = await self._send([item for item, _ in batch])
+            if not isinstance(results, list) or len(results) != len(batch):
+                raise Exception(f"batch of {len(batch)} items returned {results!r}")
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def stats(self) -> dict:
+        return {"batches": self.batches, "items": self.items, "pending": len(self._pending)}
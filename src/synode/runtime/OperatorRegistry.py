@@ -0,0 +1,92 @@
+import threading
+import time
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+
+class OperatorRegistry(Mapping):
+    """
+    alias -> operator instance, built on first access from the operator definition returned by resolve.
+    Every alias has its own lock so two threads never build the same operator twice; builds are
+    synchronous, so coroutines on one loop cannot interleave inside a build either.
+    """
+
+    def __init__(self, resolve: Callable[[str], Optional[Any]], build: Callable[[Any], Any],
+                 aliases: Callable[[], Iterable[str]]):
+        """
+        :param resolve: alias -> operator definition (None when unknown)
+        :param build: operator definition -> instance (None when it could not be built)
+        :param aliases: every alias currently defined
+        """
+        self._resolve = resolve
+        self._build = build
+        self._aliases = aliases
+        self._instances: Dict[str, Any] = {}
+        self.build_times: Dict[str, float] = {}
+        self._locks: Dict[str, threading.RLock] = {}
+        self._locks_guard = threading.Lock()
+
+    def _lock(self, alias: str) -> threading.RLock:
+        with self._locks_guard:
+            lock = self._locks.get(alias)
+            if lock is None:
+                lock = self._locks[alias] = threading.RLock()
+            return lock
+
+    def __getitem__(self, alias: str) -> Any:
+        instance = self._instances.get(alias)
+        if instance is not None:
+            return instance
+
+        with self._lock(alias):
+            instance = self._instances.get(alias)
+            if instance is not None:
+                return instance
+
+            definition = self._resolve(alias)
+            if definition is None:
+                raise KeyError(alias)
+
+            started = time.perf_counter()
+            instance = self._build(definition)
+            self.build_times[alias] = time.perf_counter() - started
+            if instance is None:
+                raise KeyError(alias)
+
+            self._instances[alias] = instance
+            return instance
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._aliases()))
+
+    def __len__(self) -> int:
+        return len(list(self._aliases()))
+
+    def __contains__(self, alias) -> bool:
+        return alias in self._instances or self._resolve(alias) is not None
+
+    def set(self, alias: str, instance: Any):
+        with self._lock(alias):
+            self._instances[alias] = instance
+
+    def discard(self, alias: str):
+        with self._lock(alias):
+            self._instances.pop(alias, None)
+            self.build_times.pop(alias, None)
+
+    def is_built(self, alias: str) -> bool:
+        return alias in self._instances
+
+    @property
+    def built(self) -> Dict[str, Any]:
+        return dict(self._instances)
+
+    def warm(self, aliases: Optional[Iterable[str]] = None):
+        """
+        Builds aliases now (every defined operator when None), unknown or failing aliases are skipped.
+        """
+        for alias in (self._aliases() if aliases is None else aliases):
+            try:
+                self[alias]
+            except KeyError:
+                pass
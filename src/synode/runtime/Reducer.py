@@ -0,0 +1,58 @@
+from typing import Any, Awaitable, Callable, Optional
+
+from .MapExecutor import MapExecutor
+
+
+class Reducer:
+    """
+    REDUCE strategies, selected with op kwargs["mode"]:
+        sequential: fold {"accumulate", "item"} over the items one call at a time (default)
+        tree:       pairwise balanced reduce, levels run in parallel. The reducer must be associative,
+                    the accumulator is folded in as the leftmost element.
+        chunked:    fold {"accumulate", "items"} over batches of kwargs["chunk_size"] items
+    tree and chunked need a constant target, the step operands are not single items.
+    """
+    SEQUENTIAL = "sequential"
+    TREE = "tree"
+    CHUNKED = "chunked"
+    MODES = (SEQUENTIAL, TREE, CHUNKED)
+
+    def __init__(self, step: Callable[[dict, Any], Awaitable[Any]], max_in_flight: int = 30, chunk_size: int = 10):
+        """
+        :param step: coroutine called with (payload, item) where item is the right hand operand
+        """
+        self._step = step
+        self.max_in_flight = max_in_flight
+        self.chunk_size = max(1, int(chunk_size))
+
+    async def reduce(self, items: list, accumulator: Optional[Any] = None, mode: str = SEQUENTIAL):
+        if mode == self.TREE:
+            return await self.tree(items, accumulator)
+        elif mode == self.CHUNKED:
+            return await self.chunked(items, accumulator)
+        return await self.fold(items, accumulator)
+
+    async def fold(self, items: list, accumulator: Optional[Any] = None):
+        for item in items:
+            accumulator = await self._step({"accumulate": accumulator, "item": item}, item)
+        return accumulator
+
+    async def chunked(self, items: list, accumulator: Optional[Any] = None):
+        for start in range(0, len(items), self.chunk_size):
+            chunk = items[start:start + self.chunk_size]
+            accumulator = await self._step({"accumulate": accumulator, "items": chunk}, chunk)
+        return accumulator
+
+    async def tree(self, items: list, accumulator: Optional[Any] = None):
+        level = [accumulator, *items]
+        executor = MapExecutor(max_in_flight=self.max_in_flight)
+
+        async def combine(pair):
+            return await self._step({"accumulate": pair[0], "item": pair[1]}, pair[1])
+
+        while len(level) > 1:
+            pairs = [(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+            carry = [level[-1]] if len(level) % 2 else []
+            level = await executor.run(pairs, combine) + carry
+
+        return level[0]
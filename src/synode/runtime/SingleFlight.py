@@ -0,0 +1,59 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent calls: the first caller for a key runs the call,
+    callers arriving while it is in flight await the same task instead of starting their own.
+    Followers receive the leader's result object as is, not a copy.
+    """
+    _process: Optional["SingleFlight"] = None
+    _process_lock = threading.Lock()
+
+    def __init__(self):
+        self._calls: Dict[Tuple[int, str], asyncio.Future] = {}
+        self.calls = 0
+        self.leaders = 0
+        self.coalesced = 0
+
+    @classmethod
+    def shared(cls) -> "SingleFlight":
+        """
+        Process wide instance, used by every Synode configured with single_flight: process.
+        """
+        with cls._process_lock:
+            if cls._process is None:
+                cls._process = cls()
+            return cls._process
+
+    async def do(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        # in-flight calls are bound to their event loop, so the loop is part of the key
+        slot = (id(asyncio.get_running_loop()), key)
+        self.calls += 1
+
+        task = self._calls.get(slot)
+        if task is not None and not task.done():
+            self.coalesced += 1
+            return await asyncio.shield(task)
+
+        self.leaders += 1
+        task = asyncio.ensure_future(call())
+        self._calls[slot] = task
+
+        def forget(done):
+            if self._calls.get(slot) is done:
+                del self._calls[slot]
+
+        task.add_done_callback(forget)
+        # shielded so a cancelled caller does not cancel the call for everyone waiting on it
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict:
+        return {
+            "calls": self.calls,
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._calls),
+        }
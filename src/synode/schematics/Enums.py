@@ -16,6 +16,15 @@ class OperatorTypes(str, Enum):
     HYDRA = "hydra"
     ARGUS = "argus"
 
+class MemoBackends(str, Enum):
+    MEMORY = "memory"
+    MEMSTORE = "memstore"
+    SQLITE = "sqlite"
+
+class MemoScopes(str, Enum):
+    SYNODE = "synode"
+    PROCESS = "process"
+
 # -- Operation Types --
 class SynodeOpType(str, Enum):
     FORK_TO = 'fork_to'
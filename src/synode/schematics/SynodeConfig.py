@@ -1,12 +1,19 @@
-from typing import List, Dict, Any, Optional, Union, Type
+from collections import deque
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Union, Type, Mapping
 
 from pydantic import BaseModel, Field, model_validator, PrivateAttr
 
 
 
 from ..Synode import Synode
-from .Enums import SynodeOpType,OperatorTypes
+from .Enums import SynodeOpType,OperatorTypes,MemoBackends,MemoScopes
 from ..blackboard.BlackboardSchemas import BlackboardInit
+from ..blackboard.types.SynodeList import SynodeList
+from ..blackboard.types.SynodeSet import SynodeSet
+from ..helpers.CompiledTemplate import CompiledTemplate
+from ..runtime.ExecutionPlan import ExecutionPlan
+from ..runtime.Reducer import Reducer
 
 
 
@@ -30,6 +37,13 @@ class SynodeOp(BaseModel):
         if self.op_type == SynodeOpType.REDUCE:
             if "accumulator" not in self.kwargs:
                 raise ValueError("`accumulator` is required in `kwargs` when `op_type` is REDUCE")
+            mode = self.kwargs.get("mode", Reducer.SEQUENTIAL)
+            if mode not in Reducer.MODES:
+                raise ValueError(f"`mode` must be one of {Reducer.MODES} when `op_type` is REDUCE")
+            # tree / chunked steps see partial results or item lists, not single items to resolve a target from
+            if mode != Reducer.SEQUENTIAL and not (isinstance(self.target, str)
+                                                   and CompiledTemplate.compile(self.target).is_constant):
+                raise ValueError(f"REDUCE `mode` {mode} requires a constant `target`")
         return self
 
     def __repr__(self):
@@ -49,6 +63,7 @@ class Operator(BaseModel):
     alias: str
     operator_path: str
     handlers: Optional[Dict[str, OperatorHandler]] = Field(default_factory=dict)
+    semaphore: Optional[int] = None
     kwargs: Optional[Dict[str, Any]] = Field(default_factory=dict)
 
     @model_validator(mode="before")
@@ -59,6 +74,16 @@ class Operator(BaseModel):
         return values
 
 
+class AgentCache(BaseModel):
+    ttl: Optional[float] = None
+    max_entries: int = 1024
+    scope: MemoScopes = MemoScopes.SYNODE
+    backend: MemoBackends = MemoBackends.MEMORY
+    namespace: Optional[str] = "synode_memo"
+    connection_name: Optional[str] = None
+    path: Optional[str] = None
+
+
 # -- Agent Representation --
 class SynodeAgent(BaseModel):
     agent: str
@@ -71,6 +96,9 @@ class SynodeAgent(BaseModel):
     run_async: Optional[bool] = False
     async_callback: Optional[str] = None
     instructions: str
+    cache: Optional[AgentCache] = None
+    batch_size: Optional[int] = None
+    batch_linger: Optional[float] = 0.05
     kwargs: Optional[Dict[str, Any]] = Field(default_factory=dict)
     operations: List[SynodeOp] = Field(default_factory=list)
     default_value: Optional[Union[Any, None]] = None
@@ -105,17 +133,147 @@ class SynodeConfig(BaseModel):
     instructions: str
     run_async: Optional[bool] = False
     async_callback: Optional[str] = None
+    semaphore: Optional[int] = None
+    single_flight: Optional[MemoScopes] = None
+    warm_operators: List[str] = Field(default_factory=list)
     triggers: List[str]
     operators: List[Operator] = Field(default_factory=list)
     synode: List[SynodeAgent]
 
     _daemon: bool = PrivateAttr(default=False)
+    _agent_index: Mapping[str, SynodeAgent] = PrivateAttr(default_factory=lambda: MappingProxyType({}))
+    _operator_index: Mapping[str, Operator] = PrivateAttr(default_factory=lambda: MappingProxyType({}))
+    _plan: Optional[ExecutionPlan] = PrivateAttr(default=None)
+    _frozen: bool = PrivateAttr(default=False)
+    _version: int = PrivateAttr(default=0)
 
     @property
     def daemon(self) -> bool:
         # Insert your logic here for determining persistence
         return self._daemon
 
+    @model_validator(mode="after")
+    def _build_indexes(self) -> "SynodeConfig":
+        self.reindex()
+        return self
+
+    @model_validator(mode="after")
+    def _check_stream_store(self) -> "SynodeConfig":
+        """
+        stream_store writes every MAP result on its own, boards that overwrite on set or keys whose default is not
+        a !ref list / set / queue would keep only the last one.
+        """
+        board = self.blackboard.blackboard_module if self.blackboard else None
+        for agent in self.synode:
+            for op in agent.operations:
+                if not (op.kwargs.get("stream_store") and op.store_key):
+                    continue
+                if not self.store_appends(op):
+                    raise ValueError(f"`stream_store` on {agent.agent}.{op.store_key} requires a !ref list, set or "
+                                     f"queue default_value")
+                if board is not None and not getattr(board, "appends", False) and not op.store_key.startswith("_"):
+                    raise ValueError(f"`stream_store` on {agent.agent}.{op.store_key} requires a blackboard that "
+                                     f"appends on set, {board.__name__} overwrites")
+        return self
+
+    def store_appends(self, op: SynodeOp) -> bool:
+        """
+        True when the default seeded for op.store_key is a type set() extends, the op default first.
+        """
+        default = op.default_value
+        if default is None:
+            for agent in self.synode:
+                if agent.store_key == op.store_key and agent.default_value is not None:
+                    default = agent.default_value
+                    break
+                other = next((o for o in agent.operations
+                              if o.store_key == op.store_key and o.default_value is not None), None)
+                if other is not None:
+                    default = other.default_value
+                    break
+        return isinstance(default, (SynodeList, SynodeSet, deque))
+
+    @staticmethod
+    def _index(items, key: str) -> Mapping[str, Any]:
+        index = {}
+        for item in items:
+            index.setdefault(getattr(item, key), item)  # first definition wins, like a linear scan
+        return MappingProxyType(index)
+
+    def reindex(self):
+        """
+        Rebuilds the read-only name -> agent and alias -> operator lookup tables.
+        """
+        self._agent_index = self._index(self.synode, "agent")
+        self._operator_index = self._index(self.operators, "alias")
+
+    @property
+    def plan(self) -> ExecutionPlan:
+        """
+        Execution plan compiled on first use and shared by every Synode built from this config.
+        """
+        if self._plan is None:
+            self._plan = ExecutionPlan(self)
+        return self._plan
+
+    @property
+    def version(self) -> int:
+        """
+        Reload generation of the source this config was validated from (see SynodeFactory.reload).
+        """
+        return self._version
+
+    @property
+    def frozen(self) -> bool:
+        return self._frozen
+
+    def freeze(self) -> "SynodeConfig":
+        """
+        Marks a validated config as shared: it is no longer mutated, Synodes work on overlay() copies.
+        The execution plan is compiled here once for every overlay.
+        """
+        _ = self.plan
+        self._frozen = True
+        return self
+
+    def overlay(self) -> "SynodeConfig":
+        """
+        Copy-on-write view for one Synode: agents, operators and the plan are shared with this config,
+        runtime changes (add_operator, set_operator_handler) only land in the overlay.
+        """
+        copied = self.model_copy(update={"operators": list(self.operators)})
+        copied._frozen = False
+        return copied
+
+    def _ensure_mutable(self):
+        if self._frozen:
+            raise Exception(f"{self.name} config is frozen, mutate an overlay() instead")
+
+    def get_agent(self, name: str) -> Optional[SynodeAgent]:
+        return self._agent_index.get(name)
+
+    def get_operator(self, alias: str) -> Optional[Operator]:
+        return self._operator_index.get(alias)
+
+    def add_operator(self, operator: Operator):
+        self._ensure_mutable()
+        self.operators.append(operator)
+        self._operator_index = self._index(self.operators, "alias")
+        self._plan = None
+
+    def set_operator_handler(self, alias: str, name: str, handler: OperatorHandler):
+        """
+        Registers a handler by replacing the operator with a copy, the shared Operator is left untouched.
+        """
+        self._ensure_mutable()
+        for index, operator in enumerate(self.operators):
+            if operator.alias == alias:
+                self.operators[index] = operator.model_copy(update={"handlers": {**operator.handlers, name: handler}})
+                break
+        else:
+            raise Exception(f"{alias} does not exist on {self.name}")
+        self._operator_index = self._index(self.operators, "alias")
+
     @classmethod
     def from_config(cls, config: Dict[str, Any], module_class: Type[Synode]) -> "SynodeConfig":
         daemon = False
@@ -139,6 +297,9 @@ class SynodeConfig(BaseModel):
                 blackboard=config.get("blackboard", None),
                 instructions=config["instructions"],
                 run_async=config.get("run_async", False),
+                semaphore=config.get("semaphore", None),
+                single_flight=config.get("single_flight", None),
+                warm_operators=config.get("warm_operators", []),
                 triggers=config.get("triggers", []),
                 operators=config.get("operators", []),
                 synode=parsed_agents
@@ -158,6 +319,7 @@ class SynodeConfig(BaseModel):
                 target=op_data["target"],
                 before=op_data.get("before", None),
                 after=op_data.get("after", None),
+                semaphore=op_data.get("semaphore", None),
                 kwargs=op_data.get("kwargs", {}),
                 store_key=op_data.get("store_key", None),
                 default_value=op_data.get("default_value", None)
@@ -171,10 +333,14 @@ class SynodeConfig(BaseModel):
             before=raw.get("before"),
             after=raw.get("after"),
             timeout=raw.get("timeout", 30),
+            semaphore=raw.get("semaphore", 30),
             async_callback=raw.get("async", None),
             run_async=raw.get("run_async", default_run_async),
             store_key=raw.get("store_key"),
             instructions=raw.get("instructions", ""),
+            cache=raw.get("cache", None),
+            batch_size=raw.get("batch_size", None),
+            batch_linger=raw.get("batch_linger", 0.05),
             operations=operations,
             kwargs=raw.get("kwargs", {}),
             default_value=raw.get("default_value", None)
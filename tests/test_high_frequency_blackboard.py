@@ -0,0 +1,61 @@
+import pytest
+
+from synode.blackboard import HighFrequencyBlackboard as module
+from synode.blackboard.HighFrequencyBlackboard import HighFrequencyBlackboard
+
+
+class _RedisHashes:
+    """
+    Hash commands of a MemStore on a client without decode_responses: fields are stored as bytes.
+    """
+
+    def __init__(self):
+        self.hashes = {}
+
+    @staticmethod
+    def _encode(value):
+        if isinstance(value, bytes):
+            return value
+        if isinstance(value, (str, int, float)) and not isinstance(value, bool):
+            return (value if isinstance(value, str) else repr(value)).encode("utf-8")
+        raise TypeError(f"invalid hash field {value!r}")
+
+    def hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update({self._encode(f): self._encode(v) for f, v in mapping.items()})
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def delete(self, key):
+        self.hashes.pop(key, None)
+
+    def keys(self, pattern="*"):
+        return list(self.hashes)
+
+
+@pytest.fixture
+def board(monkeypatch):
+    store = _RedisHashes()
+    monkeypatch.setattr(module.StoreFactory, "get_mem_store", staticmethod(lambda **kwargs: store))
+    return HighFrequencyBlackboard(namespace="hf_test", write_behind=True, flush_interval=None)
+
+
+def test_buffered_reads_match_flushed_reads(board):
+    board.set("count", 3)
+    board.set("done", True)
+    board.set("entity", {"name": "a", "score": 1.5})
+    before = {key: board.get(key) for key in ("count", "done", "entity")}
+
+    board.flush()
+    after = {key: board.get(key) for key in ("count", "done", "entity")}
+
+    assert before == after == {"count": "3", "done": "1", "entity": {"name": "a", "score": "1.5"}}
+
+
+def test_pending_fields_merge_over_flushed_hash(board):
+    board.set("entity", {"name": "a", "score": 1})
+    board.flush()
+    board.set("entity", {"score": 2})
+
+    assert board.get("entity") == {"name": "a", "score": "2"}
+    assert board.get_many(["entity", "missing"]) == {"entity": {"name": "a", "score": "2"}}
@@ -0,0 +1,51 @@
+from synode.SynodeFactory import SynodeFactory
+from synode.blackboard.types.SynodeList import SynodeList
+from synode.blackboard.types.SynodeSet import SynodeSet
+
+
+def _register(name: str):
+    SynodeFactory._preloaded_configs[name] = {
+        "name": name, "description": "d", "instructions": "i", "triggers": ["main"],
+        "blackboard": {"type": "default"},
+        "synode": [
+            {"agent": "main", "operator": "ops::echo", "instructions": "",
+             "store_key": "seen", "default_value": SynodeList(),
+             "operations": [{"op_type": "chain_to", "target": "main",
+                             "store_key": "_private", "default_value": SynodeSet()}]},
+        ],
+    }
+
+
+def test_list_defaults_are_not_shared_between_instances():
+    _register("defaults_isolation")
+    first = SynodeFactory.summon("defaults_isolation")
+    second = SynodeFactory.summon("defaults_isolation")
+
+    first.blackboard.set("seen", [0, 1, 2])
+
+    assert first.blackboard.get("seen") == [0, 1, 2]
+    assert second.blackboard.get("seen") == []
+    assert SynodeFactory.summon("defaults_isolation").blackboard.get("seen") == []
+
+
+def test_reset_reseeds_clean_defaults():
+    _register("defaults_reset")
+    synode = SynodeFactory.summon("defaults_reset")
+    synode.blackboard.set("seen", [1])
+    synode.reset()
+
+    assert synode.blackboard.get("seen") == []
+
+
+def test_private_board_defaults_are_copied():
+    from synode.blackboard.InMemoryBlackboard import InMemoryBlackboard
+
+    _register("defaults_private")
+    synode = SynodeFactory.summon("defaults_private")
+    board = InMemoryBlackboard()
+    synode._init_private_board(private_board=board)
+    board.set("_private", [1])
+
+    fresh = InMemoryBlackboard()
+    synode._init_private_board(private_board=fresh)
+    assert fresh.get("_private") == set()